@@ -1,5 +1,6 @@
 """Lightweight connection handling for MCP servers."""
 
+import json
 from abc import ABC, abstractmethod
 from contextlib import AsyncExitStack
 from typing import Any
@@ -9,6 +10,86 @@ from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 
+# Image media types accepted in Anthropic image blocks
+SUPPORTED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+
+def _image_block(data: str, mime_type: str) -> dict[str, Any]:
+    """Build a base64 image block without re-encoding the data."""
+    return {
+        "type": "image",
+        "source": {"type": "base64", "media_type": mime_type, "data": data},
+    }
+
+
+def _omitted_block(kind: str, mime_type: str | None, size: int, uri: str | None = None) -> dict[str, Any]:
+    """Build a placeholder text block for content Claude cannot receive."""
+    location = f" {uri}" if uri else ""
+    return {
+        "type": "text",
+        "text": f"[{kind}{location} ({mime_type or 'unknown type'}, {size} base64 chars) omitted: unsupported in tool results]",
+    }
+
+
+def convert_content_block(block: Any) -> dict[str, Any]:
+    """Convert a single MCP content object into an Anthropic tool_result content block.
+
+    Text is passed through as-is, images are forwarded as base64 image blocks, and
+    embedded resources become text, image or PDF document blocks depending on their
+    MIME type. Anything Claude cannot consume is replaced by a short placeholder.
+    """
+    block_type = getattr(block, "type", None)
+
+    if block_type == "text":
+        return {"type": "text", "text": block.text}
+
+    if block_type == "image":
+        if block.mimeType in SUPPORTED_IMAGE_TYPES:
+            return _image_block(block.data, block.mimeType)
+        return _omitted_block("image", block.mimeType, len(block.data))
+
+    if block_type == "audio":
+        return _omitted_block("audio", block.mimeType, len(block.data))
+
+    if block_type == "resource":
+        resource = block.resource
+        uri = str(resource.uri)
+        mime_type = resource.mimeType
+        text = getattr(resource, "text", None)
+        if text is not None:
+            return {"type": "text", "text": text}
+        blob = resource.blob
+        if mime_type in SUPPORTED_IMAGE_TYPES:
+            return _image_block(blob, mime_type)
+        if mime_type == "application/pdf":
+            return {
+                "type": "document",
+                "source": {"type": "base64", "media_type": mime_type, "data": blob},
+                "title": uri,
+            }
+        return _omitted_block("resource", mime_type, len(blob), uri)
+
+    if block_type == "resource_link":
+        return {"type": "text", "text": f"[resource link: {block.uri}]"}
+
+    return {"type": "text", "text": json.dumps(block.model_dump(mode="json"))}
+
+
+def convert_tool_result(result: Any) -> dict[str, Any]:
+    """Convert an MCP CallToolResult into Anthropic tool_result fields.
+
+    Returns:
+        Dictionary with "content" (list of content blocks) and "is_error"
+    """
+    content = [convert_content_block(block) for block in result.content]
+
+    # Servers should mirror structured output as text, so only fall back to it when there is none
+    structured = getattr(result, "structuredContent", None)
+    if structured is not None and not content:
+        content.append({"type": "text", "text": json.dumps(structured)})
+
+    return {"content": content, "is_error": bool(result.isError)}
+
 
 class MCPConnection(ABC):
     """Base class for MCP server connections."""
@@ -64,10 +145,10 @@ class MCPConnection(ABC):
             for tool in response.tools
         ]
 
-    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
-        """Call a tool on the MCP server with provided arguments."""
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Call a tool on the MCP server and return Anthropic tool_result fields."""
         result = await self.session.call_tool(tool_name, arguments=arguments)
-        return result.content
+        return convert_tool_result(result)
 
 
 class MCPConnectionStdio(MCPConnection):
@@ -5,19 +5,40 @@ This script evaluates MCP servers by running test questions against them using C
 
 import argparse
 import asyncio
+import cProfile
+import io
 import json
+import math
+import pstats
 import re
+import statistics
 import sys
 import time
 import traceback
+import tracemalloc
 import xml.etree.ElementTree as ET
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
 from connections import create_connection
 
+# Rough characters-per-token ratio used to estimate tool response token counts
+CHARS_PER_TOKEN = 4
+
+# Approximate token cost of an image or PDF block (a ~1.15 megapixel image)
+MEDIA_BLOCK_TOKENS = 1600
+
+# Default context window (in tokens) that tool responses are measured against
+DEFAULT_CONTEXT_BUDGET = 200_000
+
+# A tool is flagged when a single response uses more than this share of the context budget,
+# or when it accounts for more than DOMINANT_TOOL_SHARE of all tool response tokens in the run
+LARGE_RESPONSE_SHARE = 0.1
+DOMINANT_TOOL_SHARE = 0.75
+
 EVALUATION_PROMPT = """You are an AI assistant with access to tools.
 
 When given a task, you MUST:
@@ -83,88 +104,295 @@ def extract_xml_content(text: str, tag: str) -> str | None:
     return matches[-1].strip() if matches else None
 
 
-async def agent_loop(
-    client: Anthropic,
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text using a characters-per-token heuristic."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def measure_tool_content(content: list[dict[str, Any]]) -> tuple[int, int]:
+    """Return the raw byte size and estimated token count of tool_result content blocks."""
+    size_bytes = 0
+    tokens = 0
+    for block in content:
+        if block["type"] == "text":
+            size_bytes += len(block["text"].encode("utf-8"))
+            tokens += estimate_tokens(block["text"])
+        else:
+            size_bytes += len(block["source"]["data"])
+            tokens += MEDIA_BLOCK_TOKENS
+    return size_bytes, tokens
+
+
+def summarize_sizes(values: list[int]) -> dict[str, int]:
+    """Summarize a list of response sizes as min/median/max/total."""
+    if not values:
+        return {"min": 0, "median": 0, "max": 0, "total": 0}
+    return {
+        "min": min(values),
+        "median": int(statistics.median(values)),
+        "max": max(values),
+        "total": sum(values),
+    }
+
+
+def summarize_tool_metrics(
+    tool_metrics: dict[str, dict[str, Any]],
+    context_budget: int = DEFAULT_CONTEXT_BUDGET,
+) -> dict[str, dict[str, Any]]:
+    """Aggregate per-tool response sizes and flag tools that dominate the context budget."""
+    total_tokens = sum(sum(metrics["response_tokens"]) for metrics in tool_metrics.values())
+    summary = {}
+    for tool_name, metrics in tool_metrics.items():
+        tokens = summarize_sizes(metrics["response_tokens"])
+        context_share = tokens["total"] / total_tokens if total_tokens else 0
+        summary[tool_name] = {
+            "count": metrics["count"],
+            "errors": metrics["errors"],
+            "durations": metrics["durations"],
+            "response_bytes": summarize_sizes(metrics["response_bytes"]),
+            "response_tokens": tokens,
+            "context_share": context_share,
+            "dominates_context": (
+                tokens["max"] > context_budget * LARGE_RESPONSE_SHARE
+                or (len(tool_metrics) > 1 and context_share > DOMINANT_TOOL_SHARE)
+            ),
+        }
+    return summary
+
+
+def merge_tool_metrics(results: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Combine the raw tool metrics of every task into a single per-tool view."""
+    merged = {}
+    for result in results:
+        for tool_name, metrics in result["tool_calls"].items():
+            if tool_name not in merged:
+                merged[tool_name] = {"count": 0, "errors": 0, "durations": [], "response_bytes": [], "response_tokens": []}
+            merged[tool_name]["count"] += metrics["count"]
+            merged[tool_name]["errors"] += metrics["errors"]
+            merged[tool_name]["durations"].extend(metrics["durations"])
+            merged[tool_name]["response_bytes"].extend(metrics["response_bytes"])
+            merged[tool_name]["response_tokens"].extend(metrics["response_tokens"])
+    return merged
+
+
+def load_task_durations(results_path: Path) -> dict[str, float]:
+    """Load per-question task durations from a previous structured results file.
+
+    Tasks cut short by a budget limit are left out, since their durations understate
+    how long they really take.
+    """
+    data = json.loads(results_path.read_text())
+    return {
+        result["question"]: result["total_duration"]
+        for result in data["results"]
+        if not result.get("budget_stop")
+    }
+
+
+def schedule_tasks(qa_pairs: list[dict[str, Any]], durations: dict[str, float] | None) -> list[int]:
+    """Order task indices longest expected duration first.
+
+    Tasks without a recorded duration are scheduled before all known tasks, since
+    they could be the longest of all.
+    """
+    if not durations:
+        return list(range(len(qa_pairs)))
+
+    unknown = [i for i, qa_pair in enumerate(qa_pairs) if qa_pair["question"] not in durations]
+    known = sorted(
+        (i for i, qa_pair in enumerate(qa_pairs) if qa_pair["question"] in durations),
+        key=lambda i: durations[qa_pairs[i]["question"]],
+        reverse=True,
+    )
+    return unknown + known
+
+
+class BudgetExceeded(Exception):
+    """Raised when a task or the whole run reaches one of its limits."""
+
+
+class Budget:
+    """Track usage of a task or run against optional limits.
+
+    Supported limits are "wall_time" (seconds), "turns", "tool_calls" and "tokens";
+    a limit set to None is not enforced.
+    """
+
+    def __init__(self, scope: str, limits: dict[str, float | None] | None = None):
+        self.scope = scope
+        self.limits = {key: value for key, value in (limits or {}).items() if value is not None}
+        self.usage = {"turns": 0, "tool_calls": 0, "tokens": 0}
+        self.start = time.time()
+
+    def remaining_time(self) -> float | None:
+        """Seconds left before the wall time limit, or None if there is no limit."""
+        if "wall_time" not in self.limits:
+            return None
+        return self.limits["wall_time"] - (time.time() - self.start)
+
+    def charge(self, **amounts: int):
+        """Add usage, e.g. charge(turns=1, tokens=1200)."""
+        for key, amount in amounts.items():
+            self.usage[key] += amount
+
+    def check(self, *keys: str):
+        """Raise BudgetExceeded if the wall time or any of the given limits has been reached.
+
+        With no keys, every limit is checked.
+        """
+        remaining = self.remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise BudgetExceeded(f"{self.scope} wall_time limit ({self.limits['wall_time']}s) reached")
+        for key, used in self.usage.items():
+            if keys and key not in keys:
+                continue
+            if key in self.limits and used >= self.limits[key]:
+                raise BudgetExceeded(f"{self.scope} {key} limit ({self.limits[key]}) reached")
+
+
+def check_budgets(budgets: list[Budget], *keys: str):
+    """Raise BudgetExceeded if any of the budgets has reached its wall time or one of the given limits."""
+    for budget in budgets:
+        budget.check(*keys)
+
+
+async def call_with_deadline(budgets: list[Budget], awaitable: Any) -> Any:
+    """Await a call, giving up when the tightest wall time budget runs out."""
+    remaining = [budget.remaining_time() for budget in budgets if budget.remaining_time() is not None]
+    if not remaining:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout=max(0.0, min(remaining)))
+    except asyncio.TimeoutError:
+        check_budgets(budgets, "wall_time")
+        raise BudgetExceeded("wall_time limit reached")
+
+
+async def create_message(
+    client: AsyncAnthropic,
     model: str,
-    question: str,
+    messages: list[dict[str, Any]],
     tools: list[dict[str, Any]],
-    connection: Any,
-) -> tuple[str, dict[str, Any]]:
-    """Run the agent loop with MCP tools."""
-    messages = [{"role": "user", "content": question}]
-
-    response = await asyncio.to_thread(
-        client.messages.create,
+    budgets: list[Budget],
+) -> Any:
+    """Request the next assistant turn, charging its turn and tokens to every budget.
+
+    Only the turn and token limits are checked here, so the model always sees the
+    result of a tool call that the tool_calls limit allowed.
+    """
+    check_budgets(budgets, "turns", "tokens")
+    response = await call_with_deadline(budgets, client.messages.create(
         model=model,
         max_tokens=4096,
         system=EVALUATION_PROMPT,
         messages=messages,
         tools=tools,
-    )
+    ))
+    for budget in budgets:
+        budget.charge(turns=1, tokens=response.usage.input_tokens + response.usage.output_tokens)
+    return response
 
-    messages.append({"role": "assistant", "content": response.content})
 
+async def agent_loop(
+    client: AsyncAnthropic,
+    model: str,
+    question: str,
+    tools: list[dict[str, Any]],
+    connection: Any,
+    budgets: list[Budget] | None = None,
+) -> tuple[str | None, dict[str, Any], str | None]:
+    """Run the agent loop with MCP tools.
+
+    Returns:
+        Final response text, per-tool metrics, and the budget limit that stopped the
+        loop early (None if it finished on its own)
+    """
+    budgets = budgets or []
+    messages = [{"role": "user", "content": question}]
     tool_metrics = {}
 
-    while response.stop_reason == "tool_use":
-        tool_use = next(block for block in response.content if block.type == "tool_use")
-        tool_name = tool_use.name
-        tool_input = tool_use.input
-
-        tool_start_ts = time.time()
-        try:
-            tool_result = await connection.call_tool(tool_name, tool_input)
-            tool_response = json.dumps(tool_result) if isinstance(tool_result, (dict, list)) else str(tool_result)
-        except Exception as e:
-            tool_response = f"Error executing tool {tool_name}: {str(e)}\n"
-            tool_response += traceback.format_exc()
-        tool_duration = time.time() - tool_start_ts
-
-        if tool_name not in tool_metrics:
-            tool_metrics[tool_name] = {"count": 0, "durations": []}
-        tool_metrics[tool_name]["count"] += 1
-        tool_metrics[tool_name]["durations"].append(tool_duration)
-
-        messages.append({
-            "role": "user",
-            "content": [{
-                "type": "tool_result",
-                "tool_use_id": tool_use.id,
-                "content": tool_response,
-            }]
-        })
-
-        response = await asyncio.to_thread(
-            client.messages.create,
-            model=model,
-            max_tokens=4096,
-            system=EVALUATION_PROMPT,
-            messages=messages,
-            tools=tools,
-        )
+    try:
+        response = await create_message(client, model, messages, tools, budgets)
         messages.append({"role": "assistant", "content": response.content})
 
+        while response.stop_reason == "tool_use":
+            tool_use = next(block for block in response.content if block.type == "tool_use")
+            tool_name = tool_use.name
+            tool_input = tool_use.input
+
+            check_budgets(budgets, "tool_calls")
+            for budget in budgets:
+                budget.charge(tool_calls=1)
+
+            tool_start_ts = time.time()
+            try:
+                tool_result = await call_with_deadline(budgets, connection.call_tool(tool_name, tool_input))
+                tool_content = tool_result["content"]
+                is_error = tool_result["is_error"]
+            except BudgetExceeded:
+                raise
+            except Exception as e:
+                error_text = f"Error executing tool {tool_name}: {str(e)}\n"
+                error_text += traceback.format_exc()
+                tool_content = [{"type": "text", "text": error_text}]
+                is_error = True
+            tool_duration = time.time() - tool_start_ts
+
+            response_bytes, response_tokens = measure_tool_content(tool_content)
+            if tool_name not in tool_metrics:
+                tool_metrics[tool_name] = {"count": 0, "errors": 0, "durations": [], "response_bytes": [], "response_tokens": []}
+            tool_metrics[tool_name]["count"] += 1
+            tool_metrics[tool_name]["errors"] += int(is_error)
+            tool_metrics[tool_name]["durations"].append(tool_duration)
+            tool_metrics[tool_name]["response_bytes"].append(response_bytes)
+            tool_metrics[tool_name]["response_tokens"].append(response_tokens)
+
+            messages.append({
+                "role": "user",
+                "content": [{
+                    "type": "tool_result",
+                    "tool_use_id": tool_use.id,
+                    "content": tool_content,
+                    "is_error": is_error,
+                }]
+            })
+
+            response = await create_message(client, model, messages, tools, budgets)
+            messages.append({"role": "assistant", "content": response.content})
+    except BudgetExceeded as e:
+        print(f"⛔ Stopping task: {e}")
+        return None, tool_metrics, str(e)
+
     response_text = next(
         (block.text for block in response.content if hasattr(block, "text")),
         None,
     )
-    return response_text, tool_metrics
+    return response_text, tool_metrics, None
 
 
 async def evaluate_single_task(
-    client: Anthropic,
+    client: AsyncAnthropic,
     model: str,
     qa_pair: dict[str, Any],
     tools: list[dict[str, Any]],
     connection: Any,
     task_index: int,
+    task_limits: dict[str, float | None] | None = None,
+    run_budget: Budget | None = None,
 ) -> dict[str, Any]:
     """Evaluate a single QA pair with the given tools."""
     start_time = time.time()
 
+    budgets = [Budget("task", task_limits)]
+    if run_budget:
+        budgets.append(run_budget)
+
     print(f"Task {task_index + 1}: Running task with question: {qa_pair['question']}")
-    response, tool_metrics = await agent_loop(client, model, qa_pair["question"], tools, connection)
+    response, tool_metrics, budget_stop = await agent_loop(
+        client, model, qa_pair["question"], tools, connection, budgets
+    )
 
+    response = response or ""
     response_value = extract_xml_content(response, "response")
     summary = extract_xml_content(response, "summary")
     feedback = extract_xml_content(response, "feedback")
@@ -181,6 +409,23 @@ async def evaluate_single_task(
         "num_tool_calls": sum(len(metrics["durations"]) for metrics in tool_metrics.values()),
         "summary": summary,
         "feedback": feedback,
+        "budget_stop": budget_stop,
+    }
+
+
+def skipped_task_result(qa_pair: dict[str, Any], reason: str) -> dict[str, Any]:
+    """Result for a task that was never started because the run budget ran out."""
+    return {
+        "question": qa_pair["question"],
+        "expected": qa_pair["answer"],
+        "actual": None,
+        "score": 0,
+        "total_duration": 0.0,
+        "tool_calls": {},
+        "num_tool_calls": 0,
+        "summary": None,
+        "feedback": None,
+        "budget_stop": f"not started: {reason}",
     }
 
 
@@ -193,10 +438,24 @@ REPORT_HEADER = """
 - **Average Task Duration**: {average_duration_s:.2f}s
 - **Average Tool Calls per Task**: {average_tool_calls:.2f}
 - **Total Tool Calls**: {total_tool_calls}
+- **Total Tool Response Tokens (est.)**: {total_response_tokens}
+- **Makespan**: {makespan_s:.2f}s with {concurrency} worker(s) ({schedule} order, ideal {ideal_makespan_s:.2f}s)
+- **Worker Utilization**: {utilization:.1f}%
+- **Tasks Stopped by Budget**: {budget_stopped}/{total}
+
+## Tool Response Sizes
+
+Token counts are estimated at ~{chars_per_token} characters per token (~{media_block_tokens} per image or PDF block) against a context budget of {context_budget} tokens.
+
+| Tool | Calls | Bytes (min / median / max) | Tokens (min / median / max) | Share of Tool Tokens | Flag |
+|------|-------|----------------------------|-----------------------------|----------------------|------|
+{tool_size_rows}
 
 ---
 """
 
+TOOL_SIZE_ROW = "| `{tool_name}` | {count} | {bytes_min} / {bytes_median} / {bytes_max} | {tokens_min} / {tokens_median} / {tokens_max} | {context_share:.1f}% | {flag} |"
+
 TASK_TEMPLATE = """
 ### Task {task_num}
 
@@ -205,6 +464,7 @@ TASK_TEMPLATE = """
 **Actual Answer**: `{actual_answer}`
 **Correct**: {correct_indicator}
 **Duration**: {total_duration:.2f}s
+**Budget**: {budget_status}
 **Tool Calls**: {tool_calls}
 
 **Summary**
@@ -221,11 +481,27 @@ async def run_evaluation(
     eval_path: Path,
     connection: Any,
     model: str = "claude-3-7-sonnet-20250219",
+    context_budget: int = DEFAULT_CONTEXT_BUDGET,
+    concurrency: int = 1,
+    durations: dict[str, float] | None = None,
+    results_path: Path | None = None,
+    task_limits: dict[str, float | None] | None = None,
+    run_limits: dict[str, float | None] | None = None,
 ) -> str:
-    """Run evaluation with MCP server tools."""
+    """Run evaluation with MCP server tools.
+
+    Args:
+        concurrency: Number of tasks to run at once
+        durations: Task durations keyed by question from a previous run; when given,
+            tasks are started longest-expected-first to shorten the run's tail
+        results_path: Optional path to write structured per-task results as JSON
+        task_limits: Per-task limits on wall_time, turns, tool_calls and tokens
+        run_limits: Limits on the same quantities summed over the whole run; once
+            reached, running tasks stop and remaining tasks are not started
+    """
     print("🚀 Starting Evaluation")
 
-    client = Anthropic()
+    client = AsyncAnthropic()
 
     tools = await connection.list_tools()
     print(f"📋 Loaded {len(tools)} tools from MCP server")
@@ -233,11 +509,44 @@ async def run_evaluation(
     qa_pairs = parse_evaluation_file(eval_path)
     print(f"📋 Loaded {len(qa_pairs)} evaluation tasks")
 
-    results = []
-    for i, qa_pair in enumerate(qa_pairs):
-        print(f"Processing task {i + 1}/{len(qa_pairs)}")
-        result = await evaluate_single_task(client, model, qa_pair, tools, connection, i)
-        results.append(result)
+    order = schedule_tasks(qa_pairs, durations)
+    pending = iter(order)
+    slots = [None] * len(qa_pairs)
+    busy_time = [0.0] * concurrency
+
+    run_budget = Budget("run", run_limits)
+
+    async def worker(worker_index: int):
+        for i in pending:
+            try:
+                run_budget.check()
+            except BudgetExceeded as e:
+                slots[i] = skipped_task_result(qa_pairs[i], str(e))
+                continue
+            print(f"Processing task {i + 1}/{len(qa_pairs)}")
+            slots[i] = await evaluate_single_task(
+                client, model, qa_pairs[i], tools, connection, i, task_limits, run_budget
+            )
+            busy_time[worker_index] += slots[i]["total_duration"]
+
+    run_start = time.time()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    makespan_s = time.time() - run_start
+    results = slots
+
+    total_busy = sum(busy_time)
+    longest_task = max((r["total_duration"] for r in results), default=0)
+    ideal_makespan_s = max(total_busy / concurrency, longest_task)
+    utilization = (total_busy / (makespan_s * concurrency)) * 100 if makespan_s else 0
+
+    if results_path:
+        results_path.write_text(json.dumps({
+            "model": model,
+            "concurrency": concurrency,
+            "makespan": makespan_s,
+            "results": results,
+        }, indent=2))
+        print(f"📄 Structured results saved to {results_path}")
 
     correct = sum(r["score"] for r in results)
     accuracy = (correct / len(results)) * 100 if results else 0
@@ -245,6 +554,26 @@ async def run_evaluation(
     average_tool_calls = sum(r["num_tool_calls"] for r in results) / len(results) if results else 0
     total_tool_calls = sum(r["num_tool_calls"] for r in results)
 
+    tool_sizes = summarize_tool_metrics(merge_tool_metrics(results), context_budget)
+    total_response_tokens = sum(sizes["response_tokens"]["total"] for sizes in tool_sizes.values())
+    tool_size_rows = "\n".join(
+        TOOL_SIZE_ROW.format(
+            tool_name=tool_name,
+            count=sizes["count"],
+            bytes_min=sizes["response_bytes"]["min"],
+            bytes_median=sizes["response_bytes"]["median"],
+            bytes_max=sizes["response_bytes"]["max"],
+            tokens_min=sizes["response_tokens"]["min"],
+            tokens_median=sizes["response_tokens"]["median"],
+            tokens_max=sizes["response_tokens"]["max"],
+            context_share=sizes["context_share"] * 100,
+            flag="⚠️ dominates context" if sizes["dominates_context"] else "",
+        )
+        for tool_name, sizes in sorted(
+            tool_sizes.items(), key=lambda item: item[1]["response_tokens"]["total"], reverse=True
+        )
+    )
+
     report = REPORT_HEADER.format(
         correct=correct,
         total=len(results),
@@ -252,6 +581,17 @@ async def run_evaluation(
         average_duration_s=average_duration_s,
         average_tool_calls=average_tool_calls,
         total_tool_calls=total_tool_calls,
+        total_response_tokens=total_response_tokens,
+        chars_per_token=CHARS_PER_TOKEN,
+        media_block_tokens=MEDIA_BLOCK_TOKENS,
+        context_budget=context_budget,
+        tool_size_rows=tool_size_rows,
+        makespan_s=makespan_s,
+        concurrency=concurrency,
+        schedule="longest-first" if durations else "file",
+        ideal_makespan_s=ideal_makespan_s,
+        utilization=utilization,
+        budget_stopped=sum(1 for r in results if r["budget_stop"]),
     )
 
     report += "".join([
@@ -262,7 +602,8 @@ async def run_evaluation(
             actual_answer=result["actual"] or "N/A",
             correct_indicator="✅" if result["score"] else "❌",
             total_duration=result["total_duration"],
-            tool_calls=json.dumps(result["tool_calls"], indent=2),
+            budget_status=f"⛔ {result['budget_stop']}" if result["budget_stop"] else "within limits",
+            tool_calls=json.dumps(summarize_tool_metrics(result["tool_calls"], context_budget), indent=2),
             summary=result["summary"] or "N/A",
             feedback=result["feedback"] or "N/A",
         )
@@ -272,6 +613,88 @@ async def run_evaluation(
     return report
 
 
+class HarnessProfiler:
+    """Profile the harness itself: CPU hot spots, memory allocations and event-loop lag.
+
+    Model and tool calls are awaited on the event loop, so time spent waiting on
+    the API or the MCP server shows up as idle rather than as harness overhead.
+    """
+
+    def __init__(self, lag_interval: float = 0.05):
+        self.lag_interval = lag_interval
+        self.lags = []
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = 0
+        self._profile = cProfile.Profile()
+        self._snapshot = None
+        self._monitor = None
+        self._start_wall = 0.0
+        self._start_cpu = 0.0
+
+    async def _monitor_lag(self):
+        """Measure how late the event loop wakes up from a fixed sleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.lags.append(max(0.0, loop.time() - start - self.lag_interval))
+
+    async def __aenter__(self):
+        tracemalloc.start()
+        self._start_wall = time.time()
+        self._start_cpu = time.process_time()
+        self._monitor = asyncio.create_task(self._monitor_lag())
+        self._profile.enable()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._profile.disable()
+        self._monitor.cancel()
+        self.wall_time = time.time() - self._start_wall
+        self.cpu_time = time.process_time() - self._start_cpu
+        self._snapshot = tracemalloc.take_snapshot()
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def lag_summary(self) -> dict[str, float]:
+        """Summarize event-loop lag samples in milliseconds."""
+        if not self.lags:
+            return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+        ordered = sorted(self.lags)
+        return {
+            "mean": statistics.mean(ordered) * 1000,
+            "p95": ordered[int(0.95 * (len(ordered) - 1))] * 1000,
+            "max": ordered[-1] * 1000,
+        }
+
+    def write_report(self, path: Path, top_n: int = 25):
+        """Write the top-N hot functions and allocation sites to a side file."""
+        lag = self.lag_summary()
+        lines = [
+            "# Harness Profile",
+            "",
+            f"Wall time: {self.wall_time:.2f}s",
+            f"Process CPU time: {self.cpu_time:.2f}s",
+            f"Peak traced memory: {self.peak_memory / 1024 / 1024:.2f} MiB",
+            f"Event loop lag: mean {lag['mean']:.2f}ms, p95 {lag['p95']:.2f}ms, max {lag['max']:.2f}ms "
+            f"({len(self.lags)} samples every {self.lag_interval * 1000:.0f}ms)",
+            "",
+            f"## Top {top_n} functions by own time",
+            "",
+        ]
+
+        stream = io.StringIO()
+        pstats.Stats(self._profile, stream=stream).sort_stats("tottime").print_stats(top_n)
+        lines.append(stream.getvalue().strip())
+
+        lines += ["", f"## Top {top_n} allocation sites", ""]
+        for stat in self._snapshot.statistics("lineno")[:top_n]:
+            lines.append(str(stat))
+
+        path.write_text("\n".join(lines) + "\n")
+
+
 def parse_headers(header_list: list[str]) -> dict[str, str]:
     """Parse header strings in format 'Key: Value' into a dictionary."""
     headers = {}
@@ -316,6 +739,9 @@ Examples:
 
   # Evaluate an HTTP MCP server with custom model
   python evaluation.py -t http -u https://example.com/mcp -m claude-3-5-sonnet-20241022 eval.xml
+
+  # Run 4 tasks at a time, longest first based on a previous run's results
+  python evaluation.py -t stdio -c python -a my_server.py -j 4 --schedule-from last.json --results-json next.json eval.xml
         """,
     )
 
@@ -333,6 +759,23 @@ Examples:
     remote_group.add_argument("-H", "--header", nargs="+", dest="headers", help="HTTP headers in 'Key: Value' format (sse/http only)")
 
     parser.add_argument("-o", "--output", type=Path, help="Output file for evaluation report (default: stdout)")
+    parser.add_argument("-j", "--concurrency", type=int, default=1, help="Number of tasks to run concurrently (default: 1)")
+    parser.add_argument("--results-json", type=Path, help="Write structured per-task results (including durations) to this JSON file")
+    parser.add_argument("--schedule-from", type=Path, help="Previous --results-json file; runs tasks longest-expected-first using its durations")
+    limits_group = parser.add_argument_group("budget limits (tasks that hit a limit are stopped and reported)")
+    limits_group.add_argument("--task-timeout", type=float, help="Maximum wall time per task in seconds")
+    limits_group.add_argument("--task-max-turns", type=int, help="Maximum model turns per task")
+    limits_group.add_argument("--task-max-tool-calls", type=int, help="Maximum tool calls per task")
+    limits_group.add_argument("--task-max-tokens", type=int, help="Maximum input plus output tokens per task")
+    limits_group.add_argument("--run-timeout", type=float, help="Maximum wall time for the whole run in seconds")
+    limits_group.add_argument("--run-max-turns", type=int, help="Maximum model turns across the whole run")
+    limits_group.add_argument("--run-max-tool-calls", type=int, help="Maximum tool calls across the whole run")
+    limits_group.add_argument("--run-max-tokens", type=int, help="Maximum input plus output tokens across the whole run")
+
+    parser.add_argument("--profile", action="store_true", help="Profile harness CPU, memory and event-loop lag")
+    parser.add_argument("--profile-output", type=Path, default=Path("evaluation_profile.txt"), help="File to write the --profile results to (default: evaluation_profile.txt)")
+    parser.add_argument("--profile-top", type=int, default=25, help="Number of hot functions and allocation sites to include in the profile (default: 25)")
+    parser.add_argument("--context-budget", type=int, default=DEFAULT_CONTEXT_BUDGET, help=f"Context window in tokens used to flag oversized tool responses (default: {DEFAULT_CONTEXT_BUDGET})")
 
     args = parser.parse_args()
 
@@ -340,6 +783,18 @@ Examples:
         print(f"Error: Evaluation file not found: {args.eval_file}")
         sys.exit(1)
 
+    if args.concurrency < 1:
+        print("Error: --concurrency must be at least 1")
+        sys.exit(1)
+
+    durations = None
+    if args.schedule_from:
+        try:
+            durations = load_task_durations(args.schedule_from)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: Could not load task durations from {args.schedule_from}: {e}")
+            sys.exit(1)
+
     headers = parse_headers(args.headers) if args.headers else None
     env_vars = parse_env_vars(args.env) if args.env else None
 
@@ -360,7 +815,36 @@ Examples:
 
     async with connection:
         print("✅ Connected successfully")
-        report = await run_evaluation(args.eval_file, connection, args.model)
+        async with HarnessProfiler() if args.profile else nullcontext() as profiler:
+            report = await run_evaluation(
+                args.eval_file,
+                connection,
+                args.model,
+                context_budget=args.context_budget,
+                concurrency=args.concurrency,
+                durations=durations,
+                results_path=args.results_json,
+                task_limits={
+                    "wall_time": args.task_timeout,
+                    "turns": args.task_max_turns,
+                    "tool_calls": args.task_max_tool_calls,
+                    "tokens": args.task_max_tokens,
+                },
+                run_limits={
+                    "wall_time": args.run_timeout,
+                    "turns": args.run_max_turns,
+                    "tool_calls": args.run_max_tool_calls,
+                    "tokens": args.run_max_tokens,
+                },
+            )
+
+        if profiler:
+            profiler.write_report(args.profile_output, args.profile_top)
+            lag = profiler.lag_summary()
+            print(f"\n⏱️  Harness CPU time {profiler.cpu_time:.2f}s over {profiler.wall_time:.2f}s wall, "
+                  f"peak memory {profiler.peak_memory / 1024 / 1024:.2f} MiB, "
+                  f"event loop lag p95 {lag['p95']:.2f}ms / max {lag['max']:.2f}ms")
+            print(f"✅ Profile saved to {args.profile_output}")
 
         if args.output:
             args.output.write_text(report)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Context Cost Analyzer - Estimates how many tokens a skill costs to load
+
+Usage:
+    python analyze_context.py <path/to/skill-folder> [--history FILE] [--strict]
+    python analyze_context.py --all <path/to/tree> [--history FILE] [--strict]
+
+Examples:
+    python analyze_context.py skills/public/my-skill
+    python analyze_context.py --all plugins --history context-history.jsonl
+
+Skills load in three levels: the metadata (name + description) is always in
+context, the SKILL.md body is loaded when the skill triggers, and bundled
+references are read as needed. Each level is estimated separately and checked
+against a budget. Scripts are listed but have no budget by default, since they
+can be run without being read. Assets and files outside references/, scripts/
+and assets/ (LICENSE.txt, ...) are never loaded into context and are not counted.
+
+Token counts are estimated at ~4 characters per token.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+from package_skill import collect_files
+from quick_validate import extract_field, find_skill_dirs, read_frontmatter
+
+
+CHARS_PER_TOKEN = 4
+
+# Defaults follow the progressive disclosure guidance in SKILL.md:
+# ~100 words of metadata, <5k words of body, and >10k-word references need grep hints
+DEFAULT_BUDGETS = {
+    'metadata': 200,
+    'body': 6500,
+    'reference': 13000,
+    'script': None,
+}
+
+# Top-level folders and the loading level their files belong to; any other file
+# (LICENSE.txt, README.md, ...) is never loaded into context and counts as 'other'
+RESOURCE_KINDS = {
+    'references': 'reference',
+    'reference': 'reference',
+    'scripts': 'script',
+    'assets': 'asset',
+}
+
+
+def estimate_tokens(text):
+    """Estimate the token count of text using a characters-per-token heuristic."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def read_text(file_path):
+    """Read a file as UTF-8 text, or return None if it is binary."""
+    try:
+        return file_path.read_text(encoding='utf-8')
+    except UnicodeDecodeError:
+        return None
+
+
+def split_skill_md(content):
+    """Split SKILL.md into (frontmatter, body); frontmatter is '' if there is none."""
+    lines = content.splitlines(keepends=True)
+    if not lines or lines[0].rstrip('\n') != '---':
+        return '', content
+    for i, line in enumerate(lines[1:], start=1):
+        if line.startswith('---'):
+            return ''.join(lines[1:i]), ''.join(lines[i + 1:])
+    return '', content
+
+
+def analyze_skill(skill_path, budgets=DEFAULT_BUDGETS):
+    """
+    Estimate the context cost of a skill and check it against budgets.
+
+    Returns:
+        Dict with the skill name, per-level token totals, per-file estimates and
+        a list of budget warnings
+    """
+    skill_path = Path(skill_path).resolve()
+    skill_md = skill_path / 'SKILL.md'
+
+    frontmatter, body = split_skill_md(skill_md.read_text(encoding='utf-8'))
+    name = extract_field(frontmatter, 'name') or skill_path.name
+    description = extract_field(frontmatter, 'description') or ''
+
+    metadata_tokens = estimate_tokens(f"{name}: {description}")
+    body_tokens = estimate_tokens(body)
+
+    files = []
+    warnings = []
+    for file_path, _ in collect_files(skill_path)[0]:
+        relpath = file_path.relative_to(skill_path).as_posix()
+        if relpath == 'SKILL.md':
+            continue
+
+        kind = RESOURCE_KINDS.get(relpath.split('/')[0], 'other') if '/' in relpath else 'other'
+        text = None if kind in ('asset', 'other') else read_text(file_path)
+        tokens = estimate_tokens(text) if text is not None else 0
+        files.append({'path': relpath, 'kind': kind, 'tokens': tokens, 'bytes': file_path.stat().st_size})
+
+        budget = budgets.get(kind)
+        if budget and tokens > budget:
+            warnings.append(f"{relpath}: ~{tokens} tokens exceeds the {kind} budget of {budget}")
+
+    if budgets.get('metadata') and metadata_tokens > budgets['metadata']:
+        warnings.append(f"description: ~{metadata_tokens} tokens exceeds the metadata budget of {budgets['metadata']}")
+    if budgets.get('body') and body_tokens > budgets['body']:
+        warnings.append(f"SKILL.md body: ~{body_tokens} tokens exceeds the body budget of {budgets['body']}")
+
+    return {
+        'name': name,
+        'path': str(skill_path),
+        'metadata_tokens': metadata_tokens,
+        'body_tokens': body_tokens,
+        'reference_tokens': sum(f['tokens'] for f in files if f['kind'] == 'reference'),
+        'script_tokens': sum(f['tokens'] for f in files if f['kind'] == 'script'),
+        'files': sorted(files, key=lambda f: f['tokens'], reverse=True),
+        'warnings': warnings,
+    }
+
+
+def load_history(history_path):
+    """Return the most recent history record for each skill name."""
+    latest = {}
+    try:
+        with open(history_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    latest[record['name']] = record
+    except FileNotFoundError:
+        pass
+    return latest
+
+
+def append_history(history_path, analyses):
+    """Append one JSON line per skill with its token totals and a timestamp."""
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    with open(history_path, 'a', encoding='utf-8') as f:
+        for analysis in analyses:
+            f.write(json.dumps({
+                'timestamp': timestamp,
+                'name': analysis['name'],
+                'metadata_tokens': analysis['metadata_tokens'],
+                'body_tokens': analysis['body_tokens'],
+                'reference_tokens': analysis['reference_tokens'],
+                'script_tokens': analysis['script_tokens'],
+            }) + '\n')
+
+
+def format_change(current, previous):
+    """Format a token count with its change since the previous run, if any."""
+    if previous is None or previous == current:
+        return f"{current}"
+    return f"{current} ({current - previous:+d})"
+
+
+def print_analysis(analysis, previous=None, top=10):
+    """Print a skill's per-level totals, its largest files and any warnings."""
+    previous = previous or {}
+    print(f"📏 {analysis['name']}")
+    for level, label in [
+        ('metadata', 'Metadata (always loaded)'),
+        ('body', 'SKILL.md body (on trigger)'),
+        ('reference', 'References (as needed)'),
+        ('script', 'Scripts (if read)'),
+    ]:
+        key = f"{level}_tokens"
+        print(f"   {label:<28} ~{format_change(analysis[key], previous.get(key))} tokens")
+
+    for file in analysis['files'][:top]:
+        if file['kind'] in ('reference', 'script'):
+            print(f"     {file['path']:<50} ~{file['tokens']} tokens")
+
+    for warning in analysis['warnings']:
+        print(f"   ⚠️  {warning}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the context cost of skills and check it against budgets")
+    parser.add_argument("path", help="Skill folder, or tree to search for skills with --all")
+    parser.add_argument("--all", action="store_true", help="Analyze every skill folder (directory with SKILL.md) under path")
+    parser.add_argument("--metadata-budget", type=int, default=DEFAULT_BUDGETS['metadata'], help=f"Token budget for name + description (default: {DEFAULT_BUDGETS['metadata']})")
+    parser.add_argument("--body-budget", type=int, default=DEFAULT_BUDGETS['body'], help=f"Token budget for the SKILL.md body (default: {DEFAULT_BUDGETS['body']})")
+    parser.add_argument("--reference-budget", type=int, default=DEFAULT_BUDGETS['reference'], help=f"Token budget per reference file (default: {DEFAULT_BUDGETS['reference']})")
+    parser.add_argument("--script-budget", type=int, help="Token budget per script file (default: none)")
+    parser.add_argument("--history", type=Path, help="JSONL file to append results to and compare against the previous run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if any budget is exceeded")
+    args = parser.parse_args()
+
+    budgets = {
+        'metadata': args.metadata_budget,
+        'body': args.body_budget,
+        'reference': args.reference_budget,
+        'script': args.script_budget,
+    }
+
+    skill_dirs = find_skill_dirs(args.path) if args.all else [Path(args.path)]
+    missing = [d for d in skill_dirs if not (Path(d) / 'SKILL.md').exists()]
+    if missing or not skill_dirs:
+        print(f"❌ Error: SKILL.md not found in {missing[0] if missing else args.path}")
+        sys.exit(1)
+
+    analyses = [analyze_skill(skill_dir, budgets) for skill_dir in skill_dirs]
+    history = load_history(args.history) if args.history else {}
+
+    if args.json:
+        print(json.dumps(analyses, indent=2))
+    else:
+        for analysis in analyses:
+            print_analysis(analysis, history.get(analysis['name']))
+        over = sum(1 for a in analyses if a['warnings'])
+        print(f"{'⚠️ ' if over else '✅'} {over}/{len(analyses)} skills over budget")
+
+    if args.history:
+        append_history(args.history, analyses)
+
+    sys.exit(1 if args.strict and any(a['warnings'] for a in analyses) else 0)
+
+
+if __name__ == "__main__":
+    main()
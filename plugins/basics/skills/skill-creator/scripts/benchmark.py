@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Skill Script Benchmarks - Times scaffolding, validation and packaging on synthetic skills
+
+Usage:
+    python benchmark.py [--shape NAME ...] [--output results.json] [--compare baseline.json]
+    python benchmark.py --files N --depth D --file-size BYTES [--binary-ratio R]
+
+Examples:
+    python benchmark.py --output baseline.json
+    python benchmark.py --shape wide --shape large-assets --compare baseline.json
+    python benchmark.py --files 5000 --depth 3 --file-size 2048
+
+Each shape generates a synthetic skill tree in a temporary directory and measures
+wall time (best of --repeat untraced runs), peak memory (one further run under
+tracemalloc) and archive size for:
+
+    scaffold          init_skill on a fresh directory
+    scaffold-bulk     init_skills_from_spec creating ten skills
+    validate          validate_skill on the populated skill
+    validate-all      quick_validate.validate_all with a cold cache
+    package           package_skill building the archive from scratch
+    package-unchanged package_skill again with nothing changed
+    verify            unpack_skill.verify_skill on the archive
+
+Results are written as JSON. With --compare, steps that got slower, used more
+memory or produced a larger archive than the baseline by more than --threshold
+are reported and the script
+exits non-zero, so regressions can fail CI before a release.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from init_skill import init_skill, init_skills_from_spec
+from package_skill import package_skill
+from quick_validate import validate_all, validate_skill
+from unpack_skill import verify_skill
+
+
+RESULTS_VERSION = 1
+
+# Named tree shapes: file count, directory depth, bytes per file and share of binary files
+SHAPES = {
+    'small': {'files': 20, 'depth': 1, 'file_size': 4 * 1024, 'binary_ratio': 0.0},
+    'wide': {'files': 2000, 'depth': 1, 'file_size': 2 * 1024, 'binary_ratio': 0.1},
+    'deep': {'files': 1000, 'depth': 8, 'file_size': 2 * 1024, 'binary_ratio': 0.1},
+    'large-assets': {'files': 20, 'depth': 1, 'file_size': 10 * 1024 * 1024, 'binary_ratio': 0.5},
+}
+
+DEFAULT_SHAPES = ['small', 'wide', 'deep']
+
+WORDS = (
+    "skill reference workflow script asset template validate package context token "
+    "deploy server request response config example error retry cache index manifest"
+).split()
+
+
+def generate_skill_tree(skill_dir, files, depth, file_size, binary_ratio, seed=0):
+    """
+    Populate a skill folder with synthetic text and binary files.
+
+    Text files are pseudo-prose so they compress like real documentation; binary
+    files are random bytes with a .png extension so they are stored as-is.
+    Content is deterministic for a given seed.
+    """
+    rng = random.Random(seed)
+    for i in range(files):
+        parts = [f"level{d}" for d in range(rng.randint(0, depth - 1))] if depth > 1 else []
+        directory = skill_dir / 'references' / Path(*parts) if parts else skill_dir / 'references'
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if rng.random() < binary_ratio:
+            (directory / f"asset_{i}.png").write_bytes(rng.randbytes(file_size))
+        else:
+            words = []
+            size = 0
+            while size < file_size:
+                word = rng.choice(WORDS)
+                words.append(word)
+                size += len(word) + 1
+            (directory / f"doc_{i}.md").write_text(' '.join(words)[:file_size])
+
+
+def run_quietly(step, func, run):
+    """Call func(run) with its output suppressed, raising if the step reports failure."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(run)
+    if result is None or result is False or (isinstance(result, tuple) and result[0] is False):
+        raise RuntimeError(f"{step} failed")
+    return result
+
+
+def measure(step, func, repeat):
+    """
+    Time func over several untraced runs, then run it once more under tracemalloc.
+
+    Tracing slows allocation-heavy code unevenly, so wall time is the best of the
+    untraced runs and only the peak memory comes from the traced run. func is
+    called with the run index, so steps with side effects can use a fresh target.
+
+    Returns:
+        Tuple of (result of the first run, wall_time, peak_memory)
+    """
+    times = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        result = run_quietly(step, func, run)
+        times.append(time.perf_counter() - start)
+        if run == 0:
+            first_result = result
+
+    tracemalloc.start()
+    try:
+        run_quietly(step, func, repeat)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return first_result, min(times), peak_memory
+
+
+def benchmark_shape(shape_name, shape, work_dir, repeat=3):
+    """Run every benchmark step for one tree shape and return a result per step."""
+    root = Path(work_dir) / shape_name
+    skills_root = root / 'skills'
+    results = []
+
+    def target(run):
+        # The first run creates the skills that later steps use; the rest go to scratch folders
+        return skills_root if run == 0 else root / 'scratch' / str(run)
+
+    def record(step, func, archive=None):
+        result, wall_time, peak_memory = measure(step, func, repeat)
+        results.append({
+            'shape': shape_name,
+            'step': step,
+            'wall_time': wall_time,
+            'peak_memory': peak_memory,
+            'archive_size': archive.stat().st_size if archive else None,
+        })
+        print(f"  {step:<18} {wall_time:>8.3f}s  {peak_memory / 1024 / 1024:>8.2f} MiB")
+        return result
+
+    skill_dir = record('scaffold', lambda run: init_skill('bench-skill', target(run)))
+
+    spec_path = root / 'spec.json'
+    spec_path.write_text(json.dumps({
+        'skills': [{'name': f"bench-bulk-{i}", 'description': 'Synthetic benchmark skill'} for i in range(10)],
+    }))
+    record('scaffold-bulk', lambda run: init_skills_from_spec(spec_path, target(run)))
+
+    # Replace the TODO frontmatter so the skill validates, then grow it to the requested shape
+    (skill_dir / 'SKILL.md').write_text(
+        "---\nname: bench-skill\ndescription: Synthetic benchmark skill.\n---\n\n# Bench Skill\n"
+    )
+    generate_skill_tree(skill_dir, shape['files'], shape['depth'], shape['file_size'], shape['binary_ratio'])
+
+    cache_path = root / 'validation-cache.json'
+
+    def validate_all_cold(run):
+        cache_path.unlink(missing_ok=True)
+        return validate_all(skills_root, cache_path=cache_path)
+
+    record('validate', lambda run: validate_skill(skill_dir))
+    record('validate-all', validate_all_cold)
+
+    dist = root / 'dist'
+    archive = dist / 'bench-skill.zip'
+    record('package', lambda run: package_skill(skill_dir, dist, force=True), archive=archive)
+    record('package-unchanged', lambda run: package_skill(skill_dir, dist), archive=archive)
+    record('verify', lambda run: verify_skill(archive), archive=archive)
+
+    return results
+
+
+def relative_change(current, previous):
+    """Return the relative change from previous to current, or 0 when either is missing."""
+    if not current or not previous:
+        return 0.0
+    return current / previous - 1
+
+
+def compare_results(results, baseline, threshold, min_time):
+    """
+    Compare results against a baseline run.
+
+    Steps that took less than min_time in both runs are too noisy to judge on
+    wall time and are only checked for memory and archive size.
+
+    Returns:
+        List of regression messages for steps worse than the baseline by more than threshold
+    """
+    previous = {(r['shape'], r['step']): r for r in baseline['results']}
+    regressions = []
+    print(f"\n{'Shape':<14} {'Step':<18} {'Time':>9} {'Memory':>9} {'Archive':>9}")
+    for result in results:
+        base = previous.get((result['shape'], result['step']))
+        if not base:
+            continue
+        changes = {
+            'wall time': relative_change(result['wall_time'], base['wall_time']),
+            'peak memory': relative_change(result['peak_memory'], base['peak_memory']),
+            'archive size': relative_change(result['archive_size'], base['archive_size']),
+        }
+        print(f"{result['shape']:<14} {result['step']:<18} "
+              + ' '.join(f"{change:>+8.0%}" for change in changes.values()))
+        if max(result['wall_time'], base['wall_time']) < min_time:
+            del changes['wall time']
+        for metric, change in changes.items():
+            if change > threshold:
+                regressions.append(f"{result['shape']}/{result['step']}: {metric} {change:+.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill-creator scripts on synthetic skill trees")
+    parser.add_argument("--shape", action="append", choices=list(SHAPES), help=f"Tree shape to run; repeatable (default: {', '.join(DEFAULT_SHAPES)})")
+    parser.add_argument("--files", type=int, help="Custom shape: number of files")
+    parser.add_argument("--depth", type=int, default=1, help="Custom shape: maximum directory depth (default: 1)")
+    parser.add_argument("--file-size", type=int, default=4096, help="Custom shape: bytes per file (default: 4096)")
+    parser.add_argument("--binary-ratio", type=float, default=0.1, help="Custom shape: share of binary files (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per step; the fastest is recorded (default: 3)")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown or memory growth counted as a regression (default: 0.2)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Ignore wall time changes on steps faster than this many seconds (default: 0.05)")
+    args = parser.parse_args()
+
+    shapes = {name: SHAPES[name] for name in args.shape or ([] if args.files else DEFAULT_SHAPES)}
+    if args.files:
+        shapes['custom'] = {
+            'files': args.files,
+            'depth': args.depth,
+            'file_size': args.file_size,
+            'binary_ratio': args.binary_ratio,
+        }
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='skill-bench-') as work_dir:
+        for name, shape in shapes.items():
+            print(f"⏱️  {name}: {shape['files']} files, depth {shape['depth']}, {shape['file_size']} bytes each")
+            results += benchmark_shape(name, shape, work_dir, max(1, args.repeat))
+
+    run = {
+        'version': RESULTS_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'repeat': max(1, args.repeat),
+        'shapes': shapes,
+        'results': results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(run, indent=2))
+        print(f"\n✅ Results saved to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_results(results, baseline, args.threshold, args.min_time)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"\n✅ No regressions over {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
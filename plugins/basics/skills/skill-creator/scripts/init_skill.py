@@ -4,20 +4,52 @@ Skill Initializer - Creates a new skill from template
 
 Usage:
     init_skill.py <skill-name> --path <path>
+    init_skill.py --spec <skills.json|skills.yaml> [--path <path>]
 
 Examples:
     init_skill.py my-new-skill --path skills/public
     init_skill.py my-api-helper --path skills/private
     init_skill.py custom-skill --path /custom/location
+    init_skill.py --spec migration.yaml --path skills/private
+
+A spec file creates many skills in one run:
+
+    {
+      "path": "skills/private",
+      "defaults": {"resources": ["scripts", "references"]},
+      "skills": [
+        {"name": "billing-api", "description": "Query the billing API. Use when..."},
+        {"name": "deploy-tool", "resources": [], "templates": {"SKILL.md": "templates/skill.md"}}
+      ]
+    }
+
+Each skill may set a description, which resource directories to create
+(scripts, references, assets), and templates mapping paths inside the skill to
+template files (relative to the spec file). Templates may use the {skill_name},
+{skill_title} and {description} placeholders. Every name is validated before
+anything is written; each skill is built in a temporary directory and renamed
+into place, and if any skill fails, the skills already created in the run are
+removed again.
 """
 
+import json
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+from quick_validate import MAX_SKILL_NAME_LENGTH, validate_name
+
+
+RESOURCE_DIRS = ['scripts', 'references', 'assets']
+
+DESCRIPTION_TODO = "[TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]"
+
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
-description: [TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]
+description: {description}
 ---
 
 # {skill_title}
@@ -191,6 +223,62 @@ def title_case_skill_name(skill_name):
     return ' '.join(word.capitalize() for word in skill_name.split('-'))
 
 
+def render_template(template, skill_name, description):
+    """Fill the {skill_name}, {skill_title} and {description} placeholders of a custom template."""
+    return (
+        template
+        .replace('{skill_name}', skill_name)
+        .replace('{skill_title}', title_case_skill_name(skill_name))
+        .replace('{description}', description)
+    )
+
+
+def render_skill_files(skill_name, description=None, resources=RESOURCE_DIRS, templates=None):
+    """
+    Render the contents of every file in a new skill, without writing anything.
+
+    Args:
+        skill_name: Name of the skill
+        description: Frontmatter description (defaults to a TODO placeholder)
+        resources: Resource directories to create with example files
+        templates: Optional mapping of path within the skill to custom template text
+
+    Returns:
+        Dict mapping path within the skill to (content, executable)
+    """
+    skill_title = title_case_skill_name(skill_name)
+    description = description or DESCRIPTION_TODO
+
+    files = {
+        'SKILL.md': (SKILL_TEMPLATE.format(
+            skill_name=skill_name,
+            skill_title=skill_title,
+            description=description,
+        ), False),
+    }
+    if 'scripts' in resources:
+        files['scripts/example.py'] = (EXAMPLE_SCRIPT.format(skill_name=skill_name), True)
+    if 'references' in resources:
+        files['references/api_reference.md'] = (EXAMPLE_REFERENCE.format(skill_title=skill_title), False)
+    if 'assets' in resources:
+        files['assets/example_asset.txt'] = (EXAMPLE_ASSET, False)
+
+    for relpath, template in (templates or {}).items():
+        files[relpath] = (render_template(template, skill_name, description), relpath.endswith(('.py', '.sh')))
+
+    return files
+
+
+def write_skill_files(skill_dir, files):
+    """Write rendered skill files into skill_dir, creating parent directories as needed."""
+    for relpath, (content, executable) in files.items():
+        file_path = skill_dir / relpath
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+        if executable:
+            file_path.chmod(0o755)
+
+
 def init_skill(skill_name, path):
     """
     Initialize a new skill directory with template SKILL.md.
@@ -202,6 +290,11 @@ def init_skill(skill_name, path):
     Returns:
         Path to created skill directory, or None if error
     """
+    error = validate_name(skill_name)
+    if error:
+        print(f"❌ Error: {error}")
+        return None
+
     # Determine skill directory path
     skill_dir = Path(path).resolve() / skill_name
 
@@ -218,46 +311,13 @@ def init_skill(skill_name, path):
         print(f"❌ Error creating directory: {e}")
         return None
 
-    # Create SKILL.md from template
-    skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
-        skill_name=skill_name,
-        skill_title=skill_title
-    )
-
-    skill_md_path = skill_dir / 'SKILL.md'
-    try:
-        skill_md_path.write_text(skill_content)
-        print("✅ Created SKILL.md")
-    except Exception as e:
-        print(f"❌ Error creating SKILL.md: {e}")
-        return None
-
-    # Create resource directories with example files
+    # Create SKILL.md and resource directories with example files
     try:
-        # Create scripts/ directory with example script
-        scripts_dir = skill_dir / 'scripts'
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / 'example.py'
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-        example_script.chmod(0o755)
-        print("✅ Created scripts/example.py")
-
-        # Create references/ directory with example reference doc
-        references_dir = skill_dir / 'references'
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / 'api_reference.md'
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-        print("✅ Created references/api_reference.md")
-
-        # Create assets/ directory with example asset placeholder
-        assets_dir = skill_dir / 'assets'
-        assets_dir.mkdir(exist_ok=True)
-        example_asset = assets_dir / 'example_asset.txt'
-        example_asset.write_text(EXAMPLE_ASSET)
-        print("✅ Created assets/example_asset.txt")
+        for relpath, file in render_skill_files(skill_name).items():
+            write_skill_files(skill_dir, {relpath: file})
+            print(f"✅ Created {relpath}")
     except Exception as e:
-        print(f"❌ Error creating resource directories: {e}")
+        print(f"❌ Error creating skill files: {e}")
         return None
 
     # Print next steps
@@ -270,18 +330,181 @@ def init_skill(skill_name, path):
     return skill_dir
 
 
+def load_spec(spec_path):
+    """Load a JSON or YAML spec file; YAML requires PyYAML."""
+    spec_path = Path(spec_path)
+    text = spec_path.read_text()
+    if spec_path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is required for YAML specs (pip install pyyaml), or use a JSON spec")
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid YAML: {e}")
+    return json.loads(text)
+
+
+def plan_skills(spec, spec_dir, path=None):
+    """
+    Validate every skill in a spec and render its files, before anything is written.
+
+    Returns:
+        Tuple of (plans, errors): plans is a list of (skill_dir, files) pairs
+    """
+    if not isinstance(spec, dict):
+        return [], ["spec must be a mapping with a 'skills' list"]
+    if not isinstance(spec.get('path', ''), str):
+        return [], ["'path' must be a string"]
+    defaults = spec.get('defaults', {})
+    if not isinstance(defaults, dict):
+        return [], ["'defaults' must be a mapping"]
+    entries = spec.get('skills', [])
+    if not isinstance(entries, list):
+        return [], ["'skills' must be a list"]
+
+    base = Path(path or spec.get('path') or '.')
+    if not base.is_absolute():
+        base = (Path.cwd() if path else spec_dir) / base
+
+    plans = []
+    errors = []
+    seen = set()
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(f"skills[{index}]: must be a mapping with at least a 'name'")
+            continue
+        skill = {**defaults, **entry}
+        name = skill.get('name')
+        label = name if isinstance(name, str) else f"skills[{index}]"
+
+        if not isinstance(name, str):
+            errors.append(f"{label}: missing 'name'")
+            continue
+        error = validate_name(name)
+        if error:
+            errors.append(f"{label}: {error}")
+        if name in seen:
+            errors.append(f"{label}: duplicate name")
+        seen.add(name)
+
+        description = skill.get('description')
+        if description is not None and not isinstance(description, str):
+            errors.append(f"{label}: 'description' must be a string")
+            description = None
+        if description and ('<' in description or '>' in description or '\n' in description):
+            errors.append(f"{label}: description cannot contain angle brackets or newlines")
+
+        resources = skill.get('resources', RESOURCE_DIRS)
+        if not isinstance(resources, list) or not all(isinstance(r, str) for r in resources):
+            errors.append(f"{label}: 'resources' must be a list of directory names")
+            resources = []
+        unknown = set(resources) - set(RESOURCE_DIRS)
+        if unknown:
+            errors.append(f"{label}: unknown resource directories {sorted(unknown)}")
+
+        templates = {}
+        template_paths = skill.get('templates', {})
+        if not isinstance(template_paths, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in template_paths.items()
+        ):
+            errors.append(f"{label}: 'templates' must map target paths to template files")
+            template_paths = {}
+        for relpath, template_path in template_paths.items():
+            if Path(relpath).is_absolute() or '..' in Path(relpath).parts:
+                errors.append(f"{label}: template target '{relpath}' must stay inside the skill")
+                continue
+            try:
+                templates[relpath] = (spec_dir / template_path).read_text()
+            except OSError as e:
+                errors.append(f"{label}: cannot read template '{template_path}': {e}")
+
+        skill_dir = (base / name).resolve()
+        if skill_dir.exists():
+            errors.append(f"{label}: skill directory already exists: {skill_dir}")
+
+        if not errors:
+            plans.append((skill_dir, render_skill_files(name, description, resources, templates)))
+
+    if not plans and not errors:
+        errors.append("spec contains no skills")
+    return plans, errors
+
+
+def init_skills_from_spec(spec_path, path=None):
+    """
+    Create every skill described in a spec file.
+
+    Each skill is written to a temporary directory next to its destination and
+    renamed into place; if any skill fails, the ones created so far are removed.
+
+    Args:
+        spec_path: Path to a JSON or YAML spec file
+        path: Optional directory overriding the spec's "path"
+
+    Returns:
+        List of created skill directories, or None if error
+    """
+    spec_path = Path(spec_path).resolve()
+    try:
+        spec = load_spec(spec_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading spec {spec_path}: {e}")
+        return None
+
+    plans, errors = plan_skills(spec, spec_path.parent, path)
+    if errors:
+        print("❌ Spec validation failed, no skills were created:")
+        for error in errors:
+            print(f"   {error}")
+        return None
+
+    created = []
+    try:
+        for skill_dir, files in plans:
+            skill_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(prefix=f".{skill_dir.name}.", dir=skill_dir.parent))
+            try:
+                write_skill_files(tmp_dir, files)
+                tmp_dir.chmod(0o755)
+                os.rename(tmp_dir, skill_dir)
+            except BaseException:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+            created.append(skill_dir)
+            print(f"✅ Created {skill_dir.name} ({len(files)} files)")
+    except Exception as e:
+        print(f"❌ Error creating {skill_dir}: {e}")
+        for skill_dir in created:
+            shutil.rmtree(skill_dir, ignore_errors=True)
+        print(f"   Rolled back {len(created)} skills created in this run")
+        return None
+
+    print(f"\n✅ Initialized {len(created)} skills")
+    return created
+
+
 def main():
+    if len(sys.argv) >= 3 and sys.argv[1] == '--spec':
+        path = sys.argv[4] if len(sys.argv) >= 5 and sys.argv[3] == '--path' else None
+        print(f"🚀 Initializing skills from spec: {sys.argv[2]}")
+        print()
+        sys.exit(0 if init_skills_from_spec(sys.argv[2], path) else 1)
+
     if len(sys.argv) < 4 or sys.argv[2] != '--path':
         print("Usage: init_skill.py <skill-name> --path <path>")
+        print("       init_skill.py --spec <skills.json|skills.yaml> [--path <path>]")
         print("\nSkill name requirements:")
         print("  - Hyphen-case identifier (e.g., 'data-analyzer')")
         print("  - Lowercase letters, digits, and hyphens only")
-        print("  - Max 40 characters")
+        print(f"  - Max {MAX_SKILL_NAME_LENGTH} characters")
         print("  - Must match directory name exactly")
         print("\nExamples:")
         print("  init_skill.py my-new-skill --path skills/public")
         print("  init_skill.py my-api-helper --path skills/private")
         print("  init_skill.py custom-skill --path /custom/location")
+        print("  init_skill.py --spec migration.yaml --path skills/private")
         sys.exit(1)
 
     skill_name = sys.argv[1]
@@ -3,32 +3,414 @@
 Skill Packager - Creates a distributable zip file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--force]
+    python utils/package_skill.py --all <path/to/tree> [output-directory] [--jobs N] [--force]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py --all plugins ./dist
+
+Archives are reproducible: entries are written in sorted order with fixed
+timestamps and permissions. A manifest of file hashes is stored next to each
+archive (<skill>.manifest.json); when nothing has changed the previous archive
+is kept as-is, and unchanged files are copied from it without recompressing.
+Pass --force to rebuild from scratch.
+
+Every archive also embeds <skill>/.skill-manifest.json with the SHA-256, size
+and executable bit of each file, so unpack_skill.py can verify and install it
+without extracting to a scratch directory first.
+
+Files are deflated by default; --compression and --level pick another
+algorithm or level, and already-compressed formats (images, PDFs, fonts,
+archives) are stored as-is unless --compress-all is given. --benchmark
+compares the size and build time of each setting without writing an archive.
+
+Version control, virtualenv, cache and editor files are never packaged. A
+.skillignore file in the skill folder (gitignore syntax) excludes more.
+
+With --all, every skill folder (a directory containing SKILL.md) under the
+given tree is validated and packaged in parallel across a process pool.
 """
 
+import argparse
+import contextlib
+import copy
+import io
+import hashlib
+import json
+import os
+import re
+import shutil
+import struct
 import sys
+import tempfile
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from quick_validate import validate_skill
+from quick_validate import DEFAULT_IGNORE_DIRS, find_skill_dirs, validate_skill
+
+
+MANIFEST_VERSION = 2
+
+# Per-file hash manifest stored inside each archive, next to SKILL.md
+EMBEDDED_MANIFEST = '.skill-manifest.json'
+EMBEDDED_MANIFEST_VERSION = 1
+
+# Fixed entry timestamp so identical inputs produce byte-for-byte identical archives
+ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+COMPRESSION_METHODS = {
+    'store': zipfile.ZIP_STORED,
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+}
+
+# Valid --level range per method; store and lzma take no level
+COMPRESSION_LEVELS = {
+    'deflate': range(0, 10),
+    'bzip2': range(1, 10),
+}
+
+# Formats that are already compressed and gain nothing from another pass
+INCOMPRESSIBLE_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.heic', '.ico',
+    '.pdf', '.docx', '.xlsx', '.pptx', '.odt', '.epub',
+    '.woff', '.woff2',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar', '.jar', '.whl',
+    '.mp3', '.mp4', '.m4a', '.mov', '.webm', '.ogg', '.flac',
+}
+
+# Settings compared by --benchmark, as (method, level) pairs
+BENCHMARK_SETTINGS = [
+    ('store', None),
+    ('deflate', 1),
+    ('deflate', 6),
+    ('deflate', 9),
+    ('bzip2', 9),
+    ('lzma', None),
+]
+
+IGNORE_FILE = '.skillignore'
+
+# Always excluded, before any .skillignore rules (gitignore syntax)
+DEFAULT_IGNORE_PATTERNS = [f"{d}/" for d in DEFAULT_IGNORE_DIRS] + [
+    '*.py[cod]',
+    '.DS_Store',
+    'Thumbs.db',
+    '*.swp',
+    '*.swo',
+    '*~',
+    '/' + IGNORE_FILE,
+    '/' + EMBEDDED_MANIFEST,
+]
+
+
+def compile_ignore_pattern(pattern):
+    """
+    Compile one gitignore-style pattern into (regex, negate, dir_only).
+
+    Supports comments, negation (!), directory-only patterns (trailing /),
+    anchoring (a leading or inner /), and the *, ?, [...] and ** wildcards.
+    Returns None for blank lines and comments.
+    """
+    pattern = pattern.rstrip()
+    if not pattern or pattern.startswith('#'):
+        return None
+
+    negate = pattern.startswith('!')
+    if negate or pattern.startswith('\\'):
+        pattern = pattern[1:]
+
+    dir_only = pattern.endswith('/')
+    pattern = pattern.rstrip('/')
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            regex += '/.*'
+            i += 3
+        elif pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        elif pattern[i] == '[' and ']' in pattern[i + 2:]:
+            end = pattern.index(']', i + 2)
+            chars = pattern[i + 1:end]
+            if chars.startswith('!'):
+                chars = '^' + chars[1:]
+            regex += '[' + chars.replace('\\', '\\\\') + ']'
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+
+    if not anchored:
+        regex = '(?:.*/)?' + regex
+    return re.compile(regex + '$'), negate, dir_only
+
+
+def load_ignore_rules(skill_path):
+    """Compile the default ignore patterns followed by the skill's .skillignore, if any."""
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_file = skill_path / IGNORE_FILE
+    if ignore_file.is_file():
+        patterns += ignore_file.read_text().splitlines()
+    return [rule for rule in map(compile_ignore_pattern, patterns) if rule]
+
+
+def is_ignored(rules, relpath, is_dir):
+    """Check a path relative to the skill folder against the ignore rules; the last match wins."""
+    ignored = False
+    for regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if regex.match(relpath):
+            ignored = not negate
+    return ignored
+
+
+def path_size(path, is_dir):
+    """
+    Total size in bytes of a file, or of every file under a directory.
+
+    Symlinks are not followed, and entries that cannot be read count as zero.
+    """
+    if not is_dir:
+        try:
+            return path.lstat().st_size
+        except OSError:
+            return 0
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def hash_file(file_path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
+def collect_files(skill_path):
+    """
+    Walk a skill folder, pruning ignored directories before descending into them.
+
+    Arcnames are relative to the skill's parent so the archive contains the
+    skill folder itself, and always use forward slashes. Symlinked directories
+    are not followed.
+
+    Returns:
+        Tuple of (files, excluded): files is a list of (path, arcname) pairs sorted
+        by arcname, and excluded is a list of (path, is_dir) pairs that were skipped
+    """
+    rules = load_ignore_rules(skill_path)
+    files = []
+    excluded = []
+    stack = [skill_path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                path = Path(entry.path)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_ignored(rules, path.relative_to(skill_path).as_posix(), is_dir):
+                    excluded.append((path, is_dir))
+                elif is_dir:
+                    stack.append(path)
+                elif entry.is_file():
+                    files.append((path, path.relative_to(skill_path.parent).as_posix()))
+    return sorted(files, key=lambda item: item[1]), sorted(excluded)
+
+
+def report_excluded(skill_path, excluded, sizes=False):
+    """
+    Print the excluded paths, and with sizes=True the bytes they would have added.
+
+    Sizing walks every file inside excluded directories, which can cost far more
+    than the pruned walk itself (e.g. node_modules/), so it is opt-in.
+    """
+    if not excluded:
+        return
+    if not sizes:
+        print(f"\n🚫 Excluded {len(excluded)} paths:")
+        for path, is_dir in excluded:
+            print(f"  Excluded: {path.relative_to(skill_path).as_posix()}{'/' if is_dir else ''}")
+        return
+    sized = [(path, is_dir, path_size(path, is_dir)) for path, is_dir in excluded]
+    total = sum(size for _, _, size in sized)
+    print(f"\n🚫 Excluded {len(sized)} paths, saving {total / 1024:.1f} KB:")
+    for path, is_dir, size in sized:
+        suffix = '/' if is_dir else ''
+        print(f"  Excluded: {path.relative_to(skill_path).as_posix()}{suffix} ({size / 1024:.1f} KB)")
+
+
+def build_manifest(files):
+    """Map each arcname to the SHA-256 of its contents, its size and its executable bit."""
+    manifest = {}
+    for file_path, arcname in files:
+        stat = file_path.stat()
+        manifest[arcname] = {
+            'sha256': hash_file(file_path),
+            'size': stat.st_size,
+            'executable': bool(stat.st_mode & 0o111),
+        }
+    return manifest
+
+
+def write_embedded_manifest(zipf, skill_name, manifest):
+    """Write the per-file hash manifest into the archive, keyed by path within the skill."""
+    prefix = f"{skill_name}/"
+    data = json.dumps({
+        'version': EMBEDDED_MANIFEST_VERSION,
+        'skill': skill_name,
+        'files': {arcname[len(prefix):]: entry for arcname, entry in manifest.items()},
+    }, indent=2, sort_keys=True)
+    zipf.writestr(make_zip_info(prefix + EMBEDDED_MANIFEST, False), data)
+
+
+def load_manifest(manifest_path, zip_path):
+    """
+    Load the manifest stored with a previous archive.
+
+    Returns None if either file is missing or unreadable, or if the archive no
+    longer matches the hash recorded when it was built.
+    """
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION or not zip_path.exists():
+        return None
+    if hash_file(zip_path) != manifest.get('archive_sha256'):
+        return None
+    return manifest
+
+
+def is_incompressible(arcname):
+    """Check whether a file's extension marks it as already compressed."""
+    return Path(arcname).suffix.lower() in INCOMPRESSIBLE_EXTENSIONS
+
+
+def make_zip_info(arcname, executable, compress_type=zipfile.ZIP_DEFLATED, level=None):
+    """Create a ZipInfo with fixed metadata so archives are reproducible."""
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_TIMESTAMP)
+    info.compress_type = compress_type
+    info.create_system = 3  # Unix, so external_attr carries file permissions
+    info.external_attr = ((0o100755 if executable else 0o100644) & 0xFFFF) << 16
+
+    # ZipFile.open() reads the level from the ZipInfo; the attribute became public in Python 3.13.
+    # If neither name exists, the level is left unset and the library default is used.
+    if hasattr(zipfile.ZipInfo, 'compress_level'):
+        info.compress_level = level
+    elif hasattr(zipfile.ZipInfo, '_compresslevel'):
+        info._compresslevel = level
+    return info
+
+
+def format_ratio(info):
+    """Describe an entry's compressed size relative to its original size."""
+    ratio = info.compress_size / info.file_size * 100 if info.file_size else 100
+    method = 'stored' if info.compress_type == zipfile.ZIP_STORED else f"{ratio:.0f}%"
+    return f"{info.file_size / 1024:.1f} KB -> {info.compress_size / 1024:.1f} KB, {method}"
+
+
+LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+
+# Private zipfile helpers used to copy entries raw; recompress if a future Python drops them
+RAW_COPY_SUPPORTED = hasattr(zipfile, 'structFileHeader') and hasattr(zipfile, 'sizeFileHeader')
+
+
+def copy_compressed_entry(src_zip, info, dst_zip):
+    """
+    Copy an entry's already-compressed bytes from one archive to another.
 
-def package_skill(skill_path, output_dir=None):
+    This relies on undocumented zipfile internals (the local header struct, the
+    reader's fp, and the writer's fp, filelist, NameToInfo and start_dir), checked
+    against CPython 3.9 to 3.13. Returns False if any of them is missing, the local
+    header does not match the entry, or the entry uses a trailing data descriptor;
+    the caller then recompresses the file.
+    """
+    if not RAW_COPY_SUPPORTED or info.flag_bits & 0x08 or not hasattr(src_zip, 'fp'):
+        return False
+    if not all(hasattr(dst_zip, attr) for attr in ('fp', 'filelist', 'NameToInfo', 'start_dir')):
+        return False
+
+    src_zip.fp.seek(info.header_offset)
+    header = src_zip.fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader or not header.startswith(LOCAL_FILE_HEADER_SIGNATURE):
+        return False
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    name_length, extra_length = fields[10], fields[11]
+    name = src_zip.fp.read(name_length)
+    if name.decode('utf-8' if info.flag_bits & 0x800 else 'cp437', errors='replace') != info.filename:
+        return False
+    raw = header + name + src_zip.fp.read(extra_length + info.compress_size)
+
+    new_info = copy.copy(info)
+    new_info.header_offset = dst_zip.fp.tell()
+    dst_zip.fp.write(raw)
+    dst_zip.filelist.append(new_info)
+    dst_zip.NameToInfo[new_info.filename] = new_info
+    dst_zip.start_dir = dst_zip.fp.tell()
+    return True
+
+
+def package_skill(
+    skill_path, output_dir=None, force=False, compression='deflate', level=None, store_compressed=True,
+    report_excluded_sizes=False,
+):
     """
     Package a skill folder into a zip file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the zip file (defaults to current directory)
+        force: Rebuild the archive from scratch even if a matching manifest exists
+        compression: Compression method: 'store', 'deflate', 'bzip2' or 'lzma'
+        level: Compression level for deflate (0-9) or bzip2 (1-9); None uses the default
+        store_compressed: Store already-compressed formats instead of recompressing them
+        report_excluded_sizes: Also total the bytes of excluded paths (walks excluded directories)
 
     Returns:
         Path to the created zip file, or None if error
     """
+    start_time = time.perf_counter()
     skill_path = Path(skill_path).resolve()
 
+    if compression not in COMPRESSION_METHODS:
+        print(f"❌ Error: Unknown compression method '{compression}'. Use one of: {', '.join(COMPRESSION_METHODS)}")
+        return None
+
+    if level is not None and level not in COMPRESSION_LEVELS.get(compression, ()):
+        print(f"❌ Error: Compression level {level} is not supported for {compression}")
+        return None
+
     # Validate skill folder exists
     if not skill_path.exists():
         print(f"❌ Error: Skill folder not found: {skill_path}")
@@ -44,15 +426,6 @@ def package_skill(skill_path, output_dir=None):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Run validation before packaging
-    print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
-    if not valid:
-        print(f"❌ Validation failed: {message}")
-        print("   Please fix the validation errors before packaging.")
-        return None
-    print(f"✅ {message}\n")
-
     # Determine output location
     skill_name = skill_path.name
     if output_dir:
@@ -62,43 +435,262 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     zip_filename = output_path / f"{skill_name}.zip"
+    manifest_filename = output_path / f"{skill_name}.manifest.json"
 
-    # Create the zip file
-    try:
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+    # Compare file hashes against the previous archive's manifest
+    files, excluded = collect_files(skill_path)
+    manifest = build_manifest(files)
+    settings = {'method': compression, 'level': level, 'store_compressed': store_compressed}
+    previous = None if force else load_manifest(manifest_filename, zip_filename)
 
-        print(f"\n✅ Successfully packaged skill to: {zip_filename}")
+    # Entries compressed with different settings cannot be reused
+    if previous and previous.get('compression') != settings:
+        previous = None
+
+    if previous and previous['files'] == manifest:
+        print(f"✅ Skill unchanged, reusing {zip_filename} ({len(files)} files reused)")
         return zip_filename
 
+    # Run validation before packaging
+    print("🔍 Validating skill...")
+    valid, message = validate_skill(skill_path)
+    if not valid:
+        print(f"❌ Validation failed: {message}")
+        print("   Please fix the validation errors before packaging.")
+        return None
+    print(f"✅ {message}\n")
+
+    # Build into a temporary file, since unchanged entries are read from the previous archive
+    tmp_filename = zip_filename.with_name(zip_filename.name + '.tmp')
+    previous_files = previous['files'] if previous else {}
+    reused = 0
+
+    try:
+        with zipfile.ZipFile(tmp_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            write_embedded_manifest(zipf, skill_name, manifest)
+
+            old_zip = zipfile.ZipFile(zip_filename) if previous else None
+            try:
+                for file_path, arcname in files:
+                    if (
+                        old_zip
+                        and previous_files.get(arcname) == manifest[arcname]
+                        and copy_compressed_entry(old_zip, old_zip.getinfo(arcname), zipf)
+                    ):
+                        reused += 1
+                        print(f"  Reused: {arcname} ({format_ratio(zipf.getinfo(arcname))})")
+                        continue
+
+                    if store_compressed and is_incompressible(arcname):
+                        info = make_zip_info(arcname, manifest[arcname]['executable'], zipfile.ZIP_STORED)
+                    else:
+                        info = make_zip_info(
+                            arcname, manifest[arcname]['executable'], COMPRESSION_METHODS[compression], level
+                        )
+                    with open(file_path, 'rb') as src, zipf.open(info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+                    print(f"  Added: {arcname} ({format_ratio(info)})")
+            finally:
+                if old_zip:
+                    old_zip.close()
+
+        os.replace(tmp_filename, zip_filename)
+        manifest_filename.write_text(json.dumps({
+            'version': MANIFEST_VERSION,
+            'archive_sha256': hash_file(zip_filename),
+            'compression': settings,
+            'files': manifest,
+        }, indent=2, sort_keys=True))
+
+        total_size = sum(file_path.stat().st_size for file_path, _ in files)
+        archive_size = zip_filename.stat().st_size
+        print(f"\n✅ Successfully packaged skill to: {zip_filename}")
+        print(f"   {len(files) - reused} files written, {reused} reused from previous archive")
+        print(
+            f"   {total_size / 1024:.1f} KB -> {archive_size / 1024:.1f} KB "
+            f"with {compression}{f' level {level}' if level is not None else ''} "
+            f"in {time.perf_counter() - start_time:.2f}s"
+        )
     except Exception as e:
+        tmp_filename.unlink(missing_ok=True)
         print(f"❌ Error creating zip file: {e}")
         return None
 
+    report_excluded(skill_path, excluded, sizes=report_excluded_sizes)
+    return zip_filename
+
+
+def benchmark_compression(skill_path, settings=BENCHMARK_SETTINGS, store_compressed=True):
+    """
+    Package a skill with each compression setting and compare size and build time.
+
+    Archives are built from scratch in a temporary directory and discarded.
+
+    Returns:
+        List of dicts with method, level, size and build_time, or None if packaging failed
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for method, level in settings:
+            output_dir = Path(tmp_dir) / f"{method}-{level}"
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                zip_filename = package_skill(
+                    skill_path, output_dir, force=True,
+                    compression=method, level=level, store_compressed=store_compressed,
+                )
+            if not zip_filename:
+                print(output.getvalue().rstrip())
+                return None
+            results.append({
+                'method': method,
+                'level': level,
+                'size': zip_filename.stat().st_size,
+                'build_time': time.perf_counter() - start,
+            })
+
+    smallest = min(r['size'] for r in results)
+    print(f"{'Method':<8}  {'Level':>5}  {'Size (KB)':>9}  {'vs best':>7}  {'Time (s)':>8}")
+    for result in results:
+        level = '-' if result['level'] is None else result['level']
+        print(
+            f"{result['method']:<8}  {level:>5}  {result['size'] / 1024:>9.1f}  "
+            f"{result['size'] / smallest:>6.2f}x  {result['build_time']:>8.2f}"
+        )
+    return results
+
+
+def _package_one(skill_path, output_dir, force, options):
+    """Package a single skill in a worker process, capturing its output.
+
+    Unexpected errors are reported as a failed result rather than raised, so one
+    bad skill does not abort the rest of a bulk run.
+    """
+    start = time.perf_counter()
+    output = io.StringIO()
+    result = {
+        'name': Path(skill_path).name,
+        'path': str(skill_path),
+        'ok': False,
+        'size': 0,
+        'file_count': 0,
+        'build_time': 0.0,
+        'output': '',
+    }
+    try:
+        with contextlib.redirect_stdout(output):
+            zip_filename = package_skill(skill_path, output_dir, force=force, **options)
+        if zip_filename:
+            result['ok'] = True
+            result['size'] = zip_filename.stat().st_size
+            # Count skill files only, not the embedded manifest
+            embedded_manifest = f"{Path(skill_path).name}/{EMBEDDED_MANIFEST}"
+            with zipfile.ZipFile(zip_filename) as zipf:
+                result['file_count'] = sum(1 for name in zipf.namelist() if name != embedded_manifest)
+    except Exception as e:
+        result['ok'] = False
+        output.write(f"❌ Error: {type(e).__name__}: {e}\n")
+    result['build_time'] = time.perf_counter() - start
+    result['output'] = output.getvalue()
+    return result
+
+
+def package_all(root, output_dir=None, jobs=None, force=False, **options):
+    """
+    Validate and package every skill under root in parallel.
+
+    Args:
+        root: Directory tree to search for skill folders
+        output_dir: Optional output directory for the zip files (defaults to current directory)
+        jobs: Number of worker processes (defaults to the CPU count)
+        force: Rebuild every archive from scratch
+        options: Compression options passed on to package_skill
+
+    Returns:
+        List of per-skill result dicts, or None if no skills could be packaged
+    """
+    skill_dirs = find_skill_dirs(root)
+    if not skill_dirs:
+        print(f"❌ Error: No skill folders found under {root}")
+        return None
+
+    # Archives are named after the skill folder, so names must be unique
+    seen = {}
+    for skill_dir in skill_dirs:
+        if skill_dir.name in seen:
+            print(f"❌ Error: Duplicate skill name '{skill_dir.name}': {seen[skill_dir.name]} and {skill_dir}")
+            return None
+        seen[skill_dir.name] = skill_dir
+
+    print(f"🔍 Found {len(skill_dirs)} skills")
+    output_dir = str(Path(output_dir or Path.cwd()).resolve())
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_package_one, str(skill_dir), output_dir, force, options) for skill_dir in skill_dirs]
+        results = [future.result() for future in futures]
+
+    for result in results:
+        if not result['ok']:
+            print(f"\n❌ {result['name']} failed:")
+            print(result['output'].rstrip())
+
+    name_width = max(len('Skill'), *(len(r['name']) for r in results))
+    print(f"\n{'Skill':<{name_width}}  {'Status':<6}  {'Files':>5}  {'Size (KB)':>9}  {'Time (s)':>8}")
+    for result in results:
+        status = 'ok' if result['ok'] else 'FAILED'
+        print(
+            f"{result['name']:<{name_width}}  {status:<6}  {result['file_count']:>5}  "
+            f"{result['size'] / 1024:>9.1f}  {result['build_time']:>8.2f}"
+        )
+
+    failed = sum(1 for r in results if not r['ok'])
+    print(f"\n{'❌' if failed else '✅'} Packaged {len(results) - failed}/{len(results)} skills")
+    return results
+
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder, or every skill under a tree, into zip files",
+    )
+    parser.add_argument("path", help="Skill folder, or tree to search for skills with --all")
+    parser.add_argument("output_dir", nargs="?", help="Output directory for zip files (default: current directory)")
+    parser.add_argument("--all", action="store_true", help="Package every skill folder (directory with SKILL.md) under path")
+    parser.add_argument("--jobs", type=int, help="Worker processes for --all (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild archives from scratch, ignoring previous manifests")
+    parser.add_argument("--compression", choices=list(COMPRESSION_METHODS), default="deflate", help="Compression method (default: deflate)")
+    parser.add_argument("--level", type=int, help="Compression level: 0-9 for deflate, 1-9 for bzip2 (default: library default)")
+    parser.add_argument("--compress-all", action="store_true", help="Also recompress already-compressed formats (images, PDFs, fonts, archives)")
+    parser.add_argument("--benchmark", action="store_true", help="Compare archive size and build time across compression settings without writing an archive")
+    parser.add_argument("--report-excluded", action="store_true", help="Also report how many bytes excluded paths would have added (walks excluded directories)")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    options = {
+        'compression': args.compression,
+        'level': args.level,
+        'store_compressed': not args.compress_all,
+        'report_excluded_sizes': args.report_excluded,
+    }
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    if args.benchmark:
+        print(f"⏱️  Benchmarking compression for: {args.path}\n")
+        results = benchmark_compression(args.path, store_compressed=options['store_compressed'])
+        sys.exit(0 if results else 1)
+
+    if args.all:
+        print(f"📦 Packaging all skills under: {args.path}")
+        if args.output_dir:
+            print(f"   Output directory: {args.output_dir}")
+        print()
+
+        results = package_all(args.path, args.output_dir, jobs=args.jobs, force=args.force, **options)
+        sys.exit(0 if results and all(r['ok'] for r in results) else 1)
+
+    print(f"📦 Packaging skill: {args.path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.path, args.output_dir, force=args.force, **options)
 
     if result:
         sys.exit(0)
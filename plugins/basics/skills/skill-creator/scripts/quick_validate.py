@@ -1,13 +1,91 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --all <path/to/tree> [--jobs N] [--json] [--no-cache]
+
+With --all, every skill folder (a directory containing SKILL.md) under the tree
+is validated concurrently. Results are cached by SKILL.md modification time and
+size, so unchanged skills are not re-read on the next run.
 """
 
+import argparse
+import json
 import sys
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Bump when validation rules change so cached results are discarded
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_FILE = '.skill-validation-cache.json'
+
+# Frontmatter larger than this is treated as unterminated
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+# Longest skill name accepted by init_skill.py, packaging and install
+MAX_SKILL_NAME_LENGTH = 40
+
+# Version control, virtualenv, cache and editor directories: never searched for
+# skills, and never packaged (package_skill.py builds its ignore patterns from these)
+DEFAULT_IGNORE_DIRS = [
+    '.git',
+    '.hg',
+    '.svn',
+    '__pycache__',
+    '.venv',
+    'venv',
+    'node_modules',
+    '.pytest_cache',
+    '.mypy_cache',
+    '.ruff_cache',
+    '.idea',
+    '.vscode',
+]
+
+
+def parse_frontmatter(f):
+    """
+    Read lines from an open text file only up to the end of its YAML frontmatter.
+
+    Returns:
+        Tuple of (frontmatter, error): frontmatter is the text between the
+        opening and closing '---' lines, or None with an error message
+    """
+    first_line = f.readline()
+    if not first_line.startswith('---'):
+        return None, "No YAML frontmatter found"
+    if first_line.rstrip('\n') != '---':
+        return None, "Invalid frontmatter format"
+
+    lines = []
+    size = 0
+    for line in f:
+        if line.startswith('---'):
+            return ''.join(lines).rstrip('\n'), None
+        size += len(line)
+        if size > MAX_FRONTMATTER_BYTES:
+            break
+        lines.append(line)
+    return None, "Invalid frontmatter format"
+
+
+def read_frontmatter(skill_md):
+    """Read SKILL.md only up to the end of its YAML frontmatter; see parse_frontmatter."""
+    with open(skill_md, encoding='utf-8') as f:
+        return parse_frontmatter(f)
+
+
+def extract_field(frontmatter, field):
+    """Return the stripped value of a single-line frontmatter field, or None if absent."""
+    match = re.search(rf'{field}:\s*(.+)', frontmatter)
+    return match.group(1).strip() if match else None
+
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -17,18 +95,33 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
     
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-    
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
-    
-    frontmatter = match.group(1)
-    
+    # Read and validate frontmatter, without reading the rest of the file
+    frontmatter, error = read_frontmatter(skill_md)
+    if error:
+        return False, error
+
+    return validate_frontmatter(frontmatter)
+
+
+def validate_name(name):
+    """
+    Check a skill name against the naming requirements.
+
+    Returns:
+        Error message, or None if the name is valid
+    """
+    # Check naming convention (hyphen-case: lowercase with hyphens)
+    if not re.fullmatch(r'[a-z0-9-]+', name):
+        return f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    if name.startswith('-') or name.endswith('-') or '--' in name:
+        return f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+    if len(name) > MAX_SKILL_NAME_LENGTH:
+        return f"Name '{name}' is longer than {MAX_SKILL_NAME_LENGTH} characters"
+    return None
+
+
+def validate_frontmatter(frontmatter):
+    """Validate the fields of already-extracted SKILL.md frontmatter"""
     # Check required fields
     if 'name:' not in frontmatter:
         return False, "Missing 'name' in frontmatter"
@@ -36,30 +129,143 @@ def validate_skill(skill_path):
         return False, "Missing 'description' in frontmatter"
     
     # Extract name for validation
-    name_match = re.search(r'name:\s*(.+)', frontmatter)
-    if name_match:
-        name = name_match.group(1).strip()
-        # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
-            return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
-        if name.startswith('-') or name.endswith('-') or '--' in name:
-            return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+    name = extract_field(frontmatter, 'name')
+    if name:
+        error = validate_name(name)
+        if error:
+            return False, error
 
     # Extract and validate description
-    desc_match = re.search(r'description:\s*(.+)', frontmatter)
-    if desc_match:
-        description = desc_match.group(1).strip()
+    description = extract_field(frontmatter, 'description')
+    if description:
         # Check for angle brackets
         if '<' in description or '>' in description:
             return False, "Description cannot contain angle brackets (< or >)"
 
     return True, "Skill is valid!"
 
+
+def find_skill_dirs(root):
+    """
+    Find every skill folder (a directory containing SKILL.md) under root.
+
+    Hidden directories and DEFAULT_IGNORE_DIRS are not searched, and the walk does not
+    descend into a skill folder once found.
+    """
+    skill_dirs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if 'SKILL.md' in filenames:
+            skill_dirs.append(Path(dirpath).resolve())
+            dirnames.clear()
+        else:
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in DEFAULT_IGNORE_DIRS]
+    return sorted(skill_dirs)
+
+
+def load_cache(cache_path):
+    """Load cached validation results, or an empty cache if missing or outdated."""
+    try:
+        cache = json.loads(Path(cache_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache.get('skills', {})
+
+
+def _validate_cached(skill_dir, cache):
+    """Validate one skill, reusing the cached result if SKILL.md is unchanged."""
+    key = str(skill_dir)
+    try:
+        stat = (skill_dir / 'SKILL.md').stat()
+    except OSError:
+        return {'path': key, 'valid': False, 'message': "SKILL.md not found", 'cached': False}
+
+    cached = cache.get(key)
+    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+        return {'path': key, 'valid': cached['valid'], 'message': cached['message'], 'cached': True}
+
+    try:
+        valid, message = validate_skill(skill_dir)
+    except (OSError, UnicodeDecodeError) as e:
+        valid, message = False, f"Could not read SKILL.md: {e}"
+    return {
+        'path': key,
+        'valid': valid,
+        'message': message,
+        'cached': False,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+    }
+
+
+def validate_all(root, jobs=None, cache_path=DEFAULT_CACHE_FILE):
+    """
+    Validate every skill under root concurrently.
+
+    Args:
+        root: Directory tree to search for skill folders
+        jobs: Number of worker threads (defaults to the executor's default)
+        cache_path: JSON file caching results by SKILL.md mtime and size, or None to disable
+
+    Returns:
+        List of result dicts with path, valid, message and cached, sorted by path
+    """
+    cache = load_cache(cache_path) if cache_path else {}
+    skill_dirs = find_skill_dirs(root)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda skill_dir: _validate_cached(skill_dir, cache), skill_dirs))
+
+    if cache_path:
+        for result in results:
+            if not result['cached'] and 'mtime_ns' in result:
+                cache[result['path']] = {
+                    'mtime_ns': result['mtime_ns'],
+                    'size': result['size'],
+                    'valid': result['valid'],
+                    'message': result['message'],
+                }
+        Path(cache_path).write_text(json.dumps({'version': CACHE_VERSION, 'skills': cache}, indent=2, sort_keys=True))
+
+    return [
+        {key: result[key] for key in ('path', 'valid', 'message', 'cached')}
+        for result in results
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a skill folder, or every skill under a tree")
+    parser.add_argument("path", help="Skill folder, or tree to search for skills with --all")
+    parser.add_argument("--all", action="store_true", help="Validate every skill folder (directory with SKILL.md) under path")
+    parser.add_argument("--jobs", type=int, help="Worker threads for --all")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_FILE, help=f"Cache file for --all results (default: {DEFAULT_CACHE_FILE})")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every skill, ignoring and not writing the cache")
+    args = parser.parse_args()
+
+    if not args.all:
+        valid, message = validate_skill(args.path)
+        if args.json:
+            print(json.dumps({'path': str(Path(args.path).resolve()), 'valid': valid, 'message': message}))
+        else:
+            print(message)
+        sys.exit(0 if valid else 1)
+
+    results = validate_all(args.path, jobs=args.jobs, cache_path=None if args.no_cache else args.cache)
+    failed = [r for r in results if not r['valid']]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            status = '✅' if result['valid'] else '❌'
+            cached = ' (cached)' if result['cached'] else ''
+            print(f"{status} {result['path']}: {result['message']}{cached}")
+        print(f"\n{len(results) - len(failed)}/{len(results)} skills valid")
+
+    sys.exit(1 if failed or not results else 0)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    main()
\ No newline at end of file
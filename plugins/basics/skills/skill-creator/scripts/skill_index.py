@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Skill Index - Builds and queries a compact index of every skill in a tree
+
+Usage:
+    python skill_index.py build <path/to/tree> [--index skill-index.json]
+    python skill_index.py query <keyword> [<keyword> ...] [--index skill-index.json]
+    python skill_index.py query --name <skill-name> [--index skill-index.json]
+
+Examples:
+    python skill_index.py build plugins
+    python skill_index.py query deploy docker
+    python skill_index.py query --name kamal-deploy
+
+The index records each skill's name, description, path, content hash and file
+sizes. Rebuilding only re-reads skills whose files changed size or mtime (or
+were added or removed). Queries read only the index file.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from package_skill import collect_files, hash_file
+from quick_validate import extract_field, find_skill_dirs, read_frontmatter, validate_skill
+
+
+INDEX_VERSION = 1
+
+DEFAULT_INDEX_FILE = 'skill-index.json'
+
+
+def display_path(path, base_dir):
+    """Path relative to the index file's directory when possible, else absolute."""
+    return path.relative_to(base_dir).as_posix() if path.is_relative_to(base_dir) else str(path)
+
+
+def stat_fingerprint(files):
+    """Hash the path, size and mtime of every file, without reading contents."""
+    digest = hashlib.sha256()
+    for file_path, arcname in files:
+        stat = file_path.stat()
+        digest.update(f"{arcname}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def index_skill(skill_dir, files, fingerprint, base_dir):
+    """Build the index entry for one skill, reading its frontmatter and hashing its files."""
+    frontmatter, _ = read_frontmatter(skill_dir / 'SKILL.md')
+    valid, message = validate_skill(skill_dir)
+
+    content_hash = hashlib.sha256()
+    sizes = {}
+    for file_path, arcname in files:
+        relpath = file_path.relative_to(skill_dir).as_posix()
+        content_hash.update(f"{relpath}\0{hash_file(file_path)}\n".encode())
+        sizes[relpath] = file_path.stat().st_size
+
+    return {
+        'name': extract_field(frontmatter, 'name') if frontmatter else None,
+        'description': extract_field(frontmatter, 'description') if frontmatter else None,
+        'path': display_path(skill_dir, base_dir),
+        'valid': valid,
+        'message': message,
+        'content_hash': content_hash.hexdigest(),
+        'total_size': sum(sizes.values()),
+        'files': sizes,
+        'fingerprint': fingerprint,
+    }
+
+
+def load_index(index_path):
+    """Load an existing index, or return an empty one if missing or outdated."""
+    try:
+        index = json.loads(Path(index_path).read_text())
+    except (OSError, ValueError):
+        return {'version': INDEX_VERSION, 'skills': []}
+    if index.get('version') != INDEX_VERSION:
+        return {'version': INDEX_VERSION, 'skills': []}
+    return index
+
+
+def build_index(root, index_path=DEFAULT_INDEX_FILE):
+    """
+    Create or incrementally update the index for every skill under root.
+
+    Skills whose file list, sizes and mtimes are unchanged keep their existing
+    entry; only changed or new skills are read and hashed.
+
+    Returns:
+        The updated index dict
+    """
+    index_path = Path(index_path).resolve()
+    base_dir = index_path.parent
+    previous = {entry['path']: entry for entry in load_index(index_path)['skills']}
+
+    skills = []
+    updated = 0
+    for skill_dir in find_skill_dirs(root):
+        files, _ = collect_files(skill_dir)
+        fingerprint = stat_fingerprint(files)
+        path = display_path(skill_dir, base_dir)
+
+        entry = previous.pop(path, None)
+        if not entry or entry['fingerprint'] != fingerprint:
+            entry = index_skill(skill_dir, files, fingerprint, base_dir)
+            updated += 1
+            print(f"  Indexed: {entry['name'] or path}")
+        skills.append(entry)
+
+    index = {'version': INDEX_VERSION, 'skills': skills}
+    index_path.write_text(json.dumps(index, separators=(',', ':'), sort_keys=True))
+
+    print(f"\n✅ Indexed {len(skills)} skills to {index_path}")
+    print(f"   {updated} updated, {len(skills) - updated} unchanged, {len(previous)} removed")
+    return index
+
+
+def query_index(index, keywords=None, name=None):
+    """
+    Find skills by exact name, or by keywords that all appear in the name or description.
+
+    Matching is case-insensitive.
+    """
+    if name:
+        return [entry for entry in index['skills'] if entry['name'] == name]
+
+    keywords = [keyword.lower() for keyword in keywords or []]
+    matches = []
+    for entry in index['skills']:
+        text = f"{entry['name'] or ''} {entry['description'] or ''}".lower()
+        if all(keyword in text for keyword in keywords):
+            matches.append(entry)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query a compact index of skills")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Create or update the index for every skill under a tree")
+    build_parser.add_argument("root", help="Tree to search for skill folders")
+    build_parser.add_argument("--index", default=DEFAULT_INDEX_FILE, help=f"Index file (default: {DEFAULT_INDEX_FILE})")
+
+    query_parser = subparsers.add_parser("query", help="Search the index by name or keyword")
+    query_parser.add_argument("keywords", nargs="*", help="Keywords that must all appear in the name or description")
+    query_parser.add_argument("--name", help="Exact skill name to look up")
+    query_parser.add_argument("--index", default=DEFAULT_INDEX_FILE, help=f"Index file (default: {DEFAULT_INDEX_FILE})")
+    query_parser.add_argument("--json", action="store_true", help="Print matching entries as JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        print(f"🔍 Indexing skills under: {args.root}\n")
+        build_index(args.root, args.index)
+        sys.exit(0)
+
+    if not Path(args.index).exists():
+        print(f"❌ Error: Index not found: {args.index}. Run 'skill_index.py build <tree>' first.")
+        sys.exit(1)
+
+    matches = query_index(load_index(args.index), args.keywords, args.name)
+    if args.json:
+        print(json.dumps(matches, indent=2))
+    else:
+        for entry in matches:
+            print(f"{entry['name']}  ({entry['path']}, {entry['total_size'] / 1024:.1f} KB)")
+            print(f"  {entry['description']}")
+        if not matches:
+            print("No matching skills")
+
+    sys.exit(0 if matches else 1)
+
+
+if __name__ == "__main__":
+    main()
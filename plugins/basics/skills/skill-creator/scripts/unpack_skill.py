@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Skill Unpacker - Verifies skill archives and installs them incrementally
+
+Usage:
+    python unpack_skill.py verify <path/to/skill.zip>
+    python unpack_skill.py install <path/to/skill.zip> <install-directory>
+
+Examples:
+    python unpack_skill.py verify dist/my-skill.zip
+    python unpack_skill.py install dist/my-skill.zip ~/.claude/skills
+
+verify streams every entry through SHA-256 and checks it against the manifest
+embedded by package_skill.py, and validates the packaged SKILL.md in memory.
+Nothing is written to disk.
+
+install verifies the archive first, then writes only files whose contents
+differ from what is already installed under <install-directory>/<skill>, and
+removes files that a previous install put there but the new archive no longer
+contains.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import zipfile
+from pathlib import Path, PurePosixPath
+
+from package_skill import EMBEDDED_MANIFEST, EMBEDDED_MANIFEST_VERSION, hash_file
+from quick_validate import parse_frontmatter, validate_frontmatter, validate_name
+
+
+CHUNK_SIZE = 1024 * 1024
+
+MANIFEST_ENTRY_KEYS = {'sha256', 'size', 'executable'}
+
+# Errors raised by a corrupt entry, a non-UTF-8 SKILL.md or a malformed manifest
+VERIFY_ERRORS = (zipfile.BadZipFile, KeyError, TypeError, UnicodeDecodeError)
+
+
+def read_embedded_manifest(zipf):
+    """
+    Find and parse the manifest embedded in a skill archive.
+
+    Returns:
+        Tuple of (skill_name, manifest, error)
+    """
+    candidates = [name for name in zipf.namelist() if PurePosixPath(name).name == EMBEDDED_MANIFEST]
+    if len(candidates) != 1:
+        return None, None, "Archive has no embedded manifest (was it built with package_skill.py?)"
+
+    try:
+        manifest = json.loads(zipf.read(candidates[0]))
+    except ValueError as e:
+        return None, None, f"Embedded manifest is not valid JSON: {e}"
+    if not isinstance(manifest, dict):
+        return None, None, "Embedded manifest is not a JSON object"
+    if manifest.get('version') != EMBEDDED_MANIFEST_VERSION:
+        return None, None, f"Unsupported manifest version: {manifest.get('version')}"
+
+    # The skill name becomes a directory on install, so it must be a valid (single-segment) skill name
+    skill_name = manifest.get('skill')
+    if not isinstance(skill_name, str) or validate_name(skill_name):
+        return None, None, f"Invalid skill name in manifest: {skill_name!r}"
+    if not isinstance(manifest.get('files'), dict):
+        return None, None, "Embedded manifest has no 'files' mapping"
+    if candidates[0] != f"{skill_name}/{EMBEDDED_MANIFEST}":
+        return None, None, f"Manifest is not at {skill_name}/{EMBEDDED_MANIFEST}"
+    return skill_name, manifest['files'], None
+
+
+def is_safe_path(relpath):
+    """Reject absolute paths and paths that escape the skill folder."""
+    path = PurePosixPath(relpath)
+    return not path.is_absolute() and '..' not in path.parts and relpath != ''
+
+
+def hash_entry(zipf, arcname):
+    """Stream an archive entry through SHA-256 without writing it to disk."""
+    digest = hashlib.sha256()
+    with zipf.open(arcname) as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_archive(zipf):
+    """
+    Verify every entry of an open skill archive against its embedded manifest.
+
+    Returns:
+        Tuple of (skill_name, manifest, errors); errors is empty when the archive is intact
+    """
+    skill_name, manifest, error = read_embedded_manifest(zipf)
+    if error:
+        return None, None, [error]
+
+    errors = []
+    prefix = f"{skill_name}/"
+    entries = {}
+    for info in zipf.infolist():
+        if info.is_dir() or info.filename == prefix + EMBEDDED_MANIFEST:
+            continue
+        if not info.filename.startswith(prefix):
+            errors.append(f"{info.filename}: outside the {skill_name}/ folder")
+            continue
+        entries[info.filename[len(prefix):]] = info
+
+    for relpath in sorted(set(entries) | set(manifest)):
+        if relpath not in manifest:
+            errors.append(f"{relpath}: not listed in manifest")
+        elif relpath not in entries:
+            errors.append(f"{relpath}: listed in manifest but missing from archive")
+        elif not is_safe_path(relpath):
+            errors.append(f"{relpath}: unsafe path")
+        elif not isinstance(manifest[relpath], dict) or not MANIFEST_ENTRY_KEYS <= manifest[relpath].keys():
+            errors.append(f"{relpath}: malformed manifest entry")
+        elif entries[relpath].file_size != manifest[relpath]['size']:
+            errors.append(f"{relpath}: size {entries[relpath].file_size} does not match manifest")
+        elif hash_entry(zipf, prefix + relpath) != manifest[relpath]['sha256']:
+            errors.append(f"{relpath}: SHA-256 does not match manifest")
+
+    if 'SKILL.md' in entries:
+        with io.TextIOWrapper(zipf.open(prefix + 'SKILL.md'), encoding='utf-8') as f:
+            frontmatter, error = parse_frontmatter(f)
+        valid, message = (False, error) if error else validate_frontmatter(frontmatter)
+        if not valid:
+            errors.append(f"SKILL.md: {message}")
+    else:
+        errors.append("SKILL.md: missing from archive")
+
+    return skill_name, manifest, errors
+
+
+def verify_skill(zip_path):
+    """
+    Verify a skill archive without extracting it.
+
+    Returns:
+        True if every file matches the manifest and SKILL.md is valid, False otherwise
+    """
+    try:
+        with zipfile.ZipFile(zip_path) as zipf:
+            try:
+                skill_name, manifest, errors = verify_archive(zipf)
+            except VERIFY_ERRORS as e:
+                skill_name, manifest, errors = None, None, [f"Archive is corrupt or malformed: {e!r}"]
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"❌ Error: Could not read archive {zip_path}: {e}")
+        return False
+
+    if errors:
+        print(f"❌ Verification failed for {zip_path}:")
+        for error in errors:
+            print(f"   {error}")
+        return False
+
+    print(f"✅ {skill_name}: {len(manifest)} files verified, SKILL.md is valid")
+    return True
+
+
+def install_skill(zip_path, install_dir):
+    """
+    Verify a skill archive and install it, writing only files that changed.
+
+    Args:
+        zip_path: Path to the skill zip file
+        install_dir: Directory that contains installed skills; the skill is installed into install_dir/<skill>
+
+    Returns:
+        Path to the installed skill folder, or None if error
+    """
+    try:
+        zipf = zipfile.ZipFile(zip_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"❌ Error: Could not read archive {zip_path}: {e}")
+        return None
+
+    with zipf:
+        print("🔍 Verifying archive...")
+        try:
+            skill_name, manifest, errors = verify_archive(zipf)
+        except VERIFY_ERRORS as e:
+            skill_name, manifest, errors = None, None, [f"Archive is corrupt or malformed: {e!r}"]
+        if errors:
+            print(f"❌ Verification failed for {zip_path}:")
+            for error in errors:
+                print(f"   {error}")
+            return None
+        print(f"✅ {len(manifest)} files verified\n")
+
+        install_root = Path(install_dir).resolve()
+        skill_dir = (install_root / skill_name).resolve()
+        if skill_dir.parent != install_root:
+            print(f"❌ Error: Skill folder {skill_dir} is outside {install_root}")
+            return None
+        skill_dir.mkdir(parents=True, exist_ok=True)
+
+        # Files recorded by a previous install, so stale ones can be removed
+        installed_manifest_path = skill_dir / EMBEDDED_MANIFEST
+        try:
+            installed = json.loads(installed_manifest_path.read_text()).get('files', {})
+        except (OSError, ValueError):
+            installed = {}
+
+        written = 0
+        for relpath, entry in sorted(manifest.items()):
+            target = skill_dir / relpath
+            mode = 0o755 if entry['executable'] else 0o644
+            if target.is_file() and target.stat().st_size == entry['size'] and hash_file(target) == entry['sha256']:
+                if target.stat().st_mode & 0o777 != mode:
+                    target.chmod(mode)
+                continue
+
+            # Write beside the target and rename, so a failed install never leaves a partial file
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_target = target.with_name(target.name + '.tmp')
+            with zipf.open(f"{skill_name}/{relpath}") as src, open(tmp_target, 'wb') as dst:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                    dst.write(chunk)
+            tmp_target.chmod(mode)
+            os.replace(tmp_target, target)
+            written += 1
+            print(f"  Updated: {relpath}")
+
+        removed = 0
+        for relpath in sorted(set(installed) - set(manifest)):
+            stale = skill_dir / relpath
+            if is_safe_path(relpath) and stale.is_file():
+                stale.unlink()
+                removed += 1
+                print(f"  Removed: {relpath}")
+
+        installed_manifest_path.write_bytes(zipf.read(f"{skill_name}/{EMBEDDED_MANIFEST}"))
+
+    print(f"\n✅ Installed {skill_name} to {skill_dir}")
+    print(f"   {written} files written, {len(manifest) - written} unchanged, {removed} removed")
+    return skill_dir
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ('verify', 'install') or (sys.argv[1] == 'install' and len(sys.argv) < 4):
+        print("Usage:")
+        print("  python unpack_skill.py verify <path/to/skill.zip>")
+        print("  python unpack_skill.py install <path/to/skill.zip> <install-directory>")
+        sys.exit(1)
+
+    if sys.argv[1] == 'verify':
+        sys.exit(0 if verify_skill(sys.argv[2]) else 1)
+
+    print(f"📦 Installing skill: {sys.argv[2]}")
+    print(f"   Install directory: {sys.argv[3]}")
+    print()
+
+    result = install_skill(sys.argv[2], sys.argv[3])
+
+    if result:
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()